@@ -8,303 +8,1047 @@ comprehensive Unicode range coverage.
 
 Features:
 - Automatic discovery of firmware files in nested directory structures
-- Batch processing of all versions with timeout protection
+- Parallel batch processing of all versions with timeout protection
+- One extractor process per worker, each handling a shard of firmwares
 - Organized output by firmware version and Unicode planes
 - Progress tracking and statistical reporting
+- Machine-readable summary written to results.json
+- Result caching keyed by firmware fingerprint (skip unchanged firmwares),
+  via a .done_<fingerprint> sentinel in the output directory or a JSON cache
 
 Output Organization:
+    Range directories are nested under a 256-way hash bucket of the range
+    name (see range_bucket) so no single directory grows too large.
+
     extracted_font_all_versions/
     ├── <version>/
     │   ├── SMALL/
-    │   │   ├── Basic_Latin/
-    │   │   ├── CJK_Unified/
+    │   │   ├── <bucket 00-ff>/
+    │   │   │   └── U+0000-007F_Basic_Latin/
     │   │   └── ...
     │   └── LARGE/
-    │       ├── Basic_Latin/
-    │       ├── CJK_Unified/
+    │       ├── <bucket 00-ff>/
+    │       │   └── U+4E00-9FFF_CJK_Unified/
     │       └── ...
 """
 
 import sys
-import glob
+import io
+import mmap
+import signal
+import atexit
 import subprocess
 import os
+import re
+import struct
+import json
+import hashlib
+import argparse
+import array
+import tempfile
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 OUTPUT_BASE = 'extracted_font_all_versions'
+CACHE_DIR = os.path.join(OUTPUT_BASE, '.cache')
+LOG_DIR = os.path.join(OUTPUT_BASE, '.logs')
+RESULTS_JSON = os.path.join(OUTPUT_BASE, 'results.json')
+# Per-firmware timeout scales with image size, clamped to [MIN_TIMEOUT, MAX_TIMEOUT] seconds
+MIN_TIMEOUT = 30
+MAX_TIMEOUT = 1200
+TIMEOUT_PER_MB = 5
+
+# Matches, in the extractor's --batch log, the "##FW## <index> <version>" and
+# "##RC## <status>" sentinel lines framing each firmware, and the final
+# "  SMALL: 123 fonts extracted" summary lines
+_LOG_RE = re.compile(
+    rb'^##FW## (?P<job>\d+) (?P<version>.*?)\r?$'
+    rb'|^##RC## (?P<rc>-?\d+)'
+    rb'|\b(?P<size>SMALL|LARGE):\s*(?P<count>\d+)\s+fonts extracted',
+    re.MULTILINE
+)
+
+# os.stat results for discovered firmwares, shared by sorting and fingerprinting
+_stat_cache = {}
+# Content hashes computed for --rehash, so each firmware is read at most once
+_hash_cache = {}
+
+# Comprehensive Unicode range definitions covering all major scripts and symbols.
+# Stored as parallel tables: RANGE_NAMES[i] spans RANGE_BOUNDS[2*i]..RANGE_BOUNDS[2*i+1].
+RANGE_NAMES = (
+    "Basic_Latin",
+    "Latin_1_Supplement",
+    "Latin_Extended_A",
+    "Latin_Extended_B",
+    "IPA_Extensions",
+    "Spacing_Modifier",
+    "Combining_Diacritics",
+    "Greek_Coptic",
+    "Cyrillic",
+    "Cyrillic_Supplement",
+    "Armenian",
+    "Hebrew",
+    "Arabic",
+    "Syriac",
+    "Arabic_Supplement",
+    "Thaana",
+    "NKo",
+    "Samaritan",
+    "Mandaic",
+    "Arabic_Extended_B",
+    "Arabic_Extended_A",
+    "Devanagari",
+    "Bengali",
+    "Gurmukhi",
+    "Gujarati",
+    "Oriya",
+    "Tamil",
+    "Telugu",
+    "Kannada",
+    "Malayalam",
+    "Sinhala",
+    "Thai",
+    "Lao",
+    "Tibetan",
+    "Myanmar",
+    "Georgian",
+    "Hangul_Jamo",
+    "Ethiopic",
+    "Ethiopic_Supplement",
+    "Cherokee",
+    "UCAS",
+    "Ogham",
+    "Runic",
+    "Tagalog",
+    "Hanunoo",
+    "Buhid",
+    "Tagbanwa",
+    "Khmer",
+    "Mongolian",
+    "UCAS_Extended",
+    "Limbu",
+    "Tai_Le",
+    "New_Tai_Lue",
+    "Khmer_Symbols",
+    "Buginese",
+    "Tai_Tham",
+    "Balinese",
+    "Sundanese",
+    "Batak",
+    "Lepcha",
+    "Ol_Chiki",
+    "Cyrillic_Extended_C",
+    "Georgian_Extended",
+    "Vedic_Extensions",
+    "Phonetic_Extensions",
+    "Phonetic_Extensions_Sup",
+    "Combining_Diacritics_Sup",
+    "Latin_Extended_Additional",
+    "Greek_Extended",
+    "General_Punctuation",
+    "Superscripts_Subscripts",
+    "Currency_Symbols",
+    "Combining_Diacritics_Sym",
+    "Letterlike_Symbols",
+    "Number_Forms",
+    "Arrows",
+    "Mathematical_Operators",
+    "Misc_Technical",
+    "Control_Pictures",
+    "OCR",
+    "Enclosed_Alphanumerics",
+    "Box_Drawing",
+    "Block_Elements",
+    "Geometric_Shapes",
+    "Misc_Symbols",
+    "Dingbats",
+    "Misc_Math_Symbols_A",
+    "Supplemental_Arrows_A",
+    "Braille_Patterns",
+    "Supplemental_Arrows_B",
+    "Misc_Math_Symbols_B",
+    "Supplemental_Math_Op",
+    "Misc_Symbols_Arrows",
+    "Glagolitic",
+    "Latin_Extended_C",
+    "Coptic",
+    "Georgian_Supplement",
+    "Tifinagh",
+    "Ethiopic_Extended",
+    "Cyrillic_Extended_A",
+    "Supplemental_Punctuation",
+    "CJK_Radicals_Sup",
+    "Kangxi_Radicals",
+    "Ideographic_Description",
+    "CJK_Symbols_Punctuation",
+    "Hiragana",
+    "Katakana",
+    "Bopomofo",
+    "Hangul_Compatibility",
+    "Kanbun",
+    "Bopomofo_Extended",
+    "CJK_Strokes",
+    "Katakana_Phonetic",
+    "Enclosed_CJK",
+    "CJK_Compatibility",
+    "CJK_Extension_A",
+    "Yijing_Hexagrams",
+    "CJK_Unified",
+    "Yi_Syllables",
+    "Yi_Radicals",
+    "Lisu",
+    "Vai",
+    "Cyrillic_Extended_B",
+    "Bamum",
+    "Modifier_Tone_Letters",
+    "Latin_Extended_D",
+    "Syloti_Nagri",
+    "Indic_Number_Forms",
+    "Phags_pa",
+    "Saurashtra",
+    "Devanagari_Extended",
+    "Kayah_Li",
+    "Rejang",
+    "Hangul_Jamo_Extended_A",
+    "Javanese",
+    "Myanmar_Extended_B",
+    "Cham",
+    "Myanmar_Extended_A",
+    "Tai_Viet",
+    "Meetei_Mayek_Ext",
+    "Ethiopic_Extended_A",
+    "Latin_Extended_E",
+    "Cherokee_Supplement",
+    "Meetei_Mayek",
+    "Hangul_Syllables",
+    "Hangul_Jamo_Extended_B",
+    "Private_Use_Area",
+    "CJK_Compatibility_Ideographs",
+    "Alphabetic_Presentation_Forms",
+    "Arabic_Presentation_Forms_A",
+    "Variation_Selectors",
+    "Vertical_Forms",
+    "Combining_Half_Marks",
+    "CJK_Compatibility_Forms",
+    "Small_Form_Variants",
+    "Arabic_Presentation_Forms_B",
+    "Halfwidth_Fullwidth",
+    "Specials",
+)
+
+RANGE_BOUNDS = array.array('I', (
+    0x0000, 0x007F,  # Basic_Latin
+    0x0080, 0x00FF,  # Latin_1_Supplement
+    0x0100, 0x017F,  # Latin_Extended_A
+    0x0180, 0x024F,  # Latin_Extended_B
+    0x0250, 0x02AF,  # IPA_Extensions
+    0x02B0, 0x02FF,  # Spacing_Modifier
+    0x0300, 0x036F,  # Combining_Diacritics
+    0x0370, 0x03FF,  # Greek_Coptic
+    0x0400, 0x04FF,  # Cyrillic
+    0x0500, 0x052F,  # Cyrillic_Supplement
+    0x0530, 0x058F,  # Armenian
+    0x0590, 0x05FF,  # Hebrew
+    0x0600, 0x06FF,  # Arabic
+    0x0700, 0x074F,  # Syriac
+    0x0750, 0x077F,  # Arabic_Supplement
+    0x0780, 0x07BF,  # Thaana
+    0x07C0, 0x07FF,  # NKo
+    0x0800, 0x083F,  # Samaritan
+    0x0840, 0x085F,  # Mandaic
+    0x0870, 0x089F,  # Arabic_Extended_B
+    0x08A0, 0x08FF,  # Arabic_Extended_A
+    0x0900, 0x097F,  # Devanagari
+    0x0980, 0x09FF,  # Bengali
+    0x0A00, 0x0A7F,  # Gurmukhi
+    0x0A80, 0x0AFF,  # Gujarati
+    0x0B00, 0x0B7F,  # Oriya
+    0x0B80, 0x0BFF,  # Tamil
+    0x0C00, 0x0C7F,  # Telugu
+    0x0C80, 0x0CFF,  # Kannada
+    0x0D00, 0x0D7F,  # Malayalam
+    0x0D80, 0x0DFF,  # Sinhala
+    0x0E00, 0x0E7F,  # Thai
+    0x0E80, 0x0EFF,  # Lao
+    0x0F00, 0x0FFF,  # Tibetan
+    0x1000, 0x109F,  # Myanmar
+    0x10A0, 0x10FF,  # Georgian
+    0x1100, 0x11FF,  # Hangul_Jamo
+    0x1200, 0x137F,  # Ethiopic
+    0x1380, 0x139F,  # Ethiopic_Supplement
+    0x13A0, 0x13FF,  # Cherokee
+    0x1400, 0x167F,  # UCAS
+    0x1680, 0x169F,  # Ogham
+    0x16A0, 0x16FF,  # Runic
+    0x1700, 0x171F,  # Tagalog
+    0x1720, 0x173F,  # Hanunoo
+    0x1740, 0x175F,  # Buhid
+    0x1760, 0x177F,  # Tagbanwa
+    0x1780, 0x17FF,  # Khmer
+    0x1800, 0x18AF,  # Mongolian
+    0x18B0, 0x18FF,  # UCAS_Extended
+    0x1900, 0x194F,  # Limbu
+    0x1950, 0x197F,  # Tai_Le
+    0x1980, 0x19DF,  # New_Tai_Lue
+    0x19E0, 0x19FF,  # Khmer_Symbols
+    0x1A00, 0x1A1F,  # Buginese
+    0x1A20, 0x1AAF,  # Tai_Tham
+    0x1B00, 0x1B7F,  # Balinese
+    0x1B80, 0x1BBF,  # Sundanese
+    0x1BC0, 0x1BFF,  # Batak
+    0x1C00, 0x1C4F,  # Lepcha
+    0x1C50, 0x1C7F,  # Ol_Chiki
+    0x1C80, 0x1C8F,  # Cyrillic_Extended_C
+    0x1C90, 0x1CBF,  # Georgian_Extended
+    0x1CD0, 0x1CFF,  # Vedic_Extensions
+    0x1D00, 0x1D7F,  # Phonetic_Extensions
+    0x1D80, 0x1DBF,  # Phonetic_Extensions_Sup
+    0x1DC0, 0x1DFF,  # Combining_Diacritics_Sup
+    0x1E00, 0x1EFF,  # Latin_Extended_Additional
+    0x1F00, 0x1FFF,  # Greek_Extended
+    0x2000, 0x206F,  # General_Punctuation
+    0x2070, 0x209F,  # Superscripts_Subscripts
+    0x20A0, 0x20CF,  # Currency_Symbols
+    0x20D0, 0x20FF,  # Combining_Diacritics_Sym
+    0x2100, 0x214F,  # Letterlike_Symbols
+    0x2150, 0x218F,  # Number_Forms
+    0x2190, 0x21FF,  # Arrows
+    0x2200, 0x22FF,  # Mathematical_Operators
+    0x2300, 0x23FF,  # Misc_Technical
+    0x2400, 0x243F,  # Control_Pictures
+    0x2440, 0x245F,  # OCR
+    0x2460, 0x24FF,  # Enclosed_Alphanumerics
+    0x2500, 0x257F,  # Box_Drawing
+    0x2580, 0x259F,  # Block_Elements
+    0x25A0, 0x25FF,  # Geometric_Shapes
+    0x2600, 0x26FF,  # Misc_Symbols
+    0x2700, 0x27BF,  # Dingbats
+    0x27C0, 0x27EF,  # Misc_Math_Symbols_A
+    0x27F0, 0x27FF,  # Supplemental_Arrows_A
+    0x2800, 0x28FF,  # Braille_Patterns
+    0x2900, 0x297F,  # Supplemental_Arrows_B
+    0x2980, 0x29FF,  # Misc_Math_Symbols_B
+    0x2A00, 0x2AFF,  # Supplemental_Math_Op
+    0x2B00, 0x2BFF,  # Misc_Symbols_Arrows
+    0x2C00, 0x2C5F,  # Glagolitic
+    0x2C60, 0x2C7F,  # Latin_Extended_C
+    0x2C80, 0x2CFF,  # Coptic
+    0x2D00, 0x2D2F,  # Georgian_Supplement
+    0x2D30, 0x2D7F,  # Tifinagh
+    0x2D80, 0x2DDF,  # Ethiopic_Extended
+    0x2DE0, 0x2DFF,  # Cyrillic_Extended_A
+    0x2E00, 0x2E7F,  # Supplemental_Punctuation
+    0x2E80, 0x2EFF,  # CJK_Radicals_Sup
+    0x2F00, 0x2FDF,  # Kangxi_Radicals
+    0x2FF0, 0x2FFF,  # Ideographic_Description
+    0x3000, 0x303F,  # CJK_Symbols_Punctuation
+    0x3040, 0x309F,  # Hiragana
+    0x30A0, 0x30FF,  # Katakana
+    0x3100, 0x312F,  # Bopomofo
+    0x3130, 0x318F,  # Hangul_Compatibility
+    0x3190, 0x319F,  # Kanbun
+    0x31A0, 0x31BF,  # Bopomofo_Extended
+    0x31C0, 0x31EF,  # CJK_Strokes
+    0x31F0, 0x31FF,  # Katakana_Phonetic
+    0x3200, 0x32FF,  # Enclosed_CJK
+    0x3300, 0x33FF,  # CJK_Compatibility
+    0x3400, 0x4DBF,  # CJK_Extension_A
+    0x4DC0, 0x4DFF,  # Yijing_Hexagrams
+    0x4E00, 0x9FFF,  # CJK_Unified
+    0xA000, 0xA48F,  # Yi_Syllables
+    0xA490, 0xA4CF,  # Yi_Radicals
+    0xA4D0, 0xA4FF,  # Lisu
+    0xA500, 0xA63F,  # Vai
+    0xA640, 0xA69F,  # Cyrillic_Extended_B
+    0xA6A0, 0xA6FF,  # Bamum
+    0xA700, 0xA71F,  # Modifier_Tone_Letters
+    0xA720, 0xA7FF,  # Latin_Extended_D
+    0xA800, 0xA82F,  # Syloti_Nagri
+    0xA830, 0xA83F,  # Indic_Number_Forms
+    0xA840, 0xA87F,  # Phags_pa
+    0xA880, 0xA8DF,  # Saurashtra
+    0xA8E0, 0xA8FF,  # Devanagari_Extended
+    0xA900, 0xA92F,  # Kayah_Li
+    0xA930, 0xA95F,  # Rejang
+    0xA960, 0xA97F,  # Hangul_Jamo_Extended_A
+    0xA980, 0xA9DF,  # Javanese
+    0xA9E0, 0xA9FF,  # Myanmar_Extended_B
+    0xAA00, 0xAA5F,  # Cham
+    0xAA60, 0xAA7F,  # Myanmar_Extended_A
+    0xAA80, 0xAADF,  # Tai_Viet
+    0xAAE0, 0xAAFF,  # Meetei_Mayek_Ext
+    0xAB00, 0xAB2F,  # Ethiopic_Extended_A
+    0xAB30, 0xAB6F,  # Latin_Extended_E
+    0xAB70, 0xABBF,  # Cherokee_Supplement
+    0xABC0, 0xABFF,  # Meetei_Mayek
+    0xAC00, 0xD7AF,  # Hangul_Syllables
+    0xD7B0, 0xD7FF,  # Hangul_Jamo_Extended_B
+    0xE000, 0xF8FF,  # Private_Use_Area
+    0xF900, 0xFAFF,  # CJK_Compatibility_Ideographs
+    0xFB00, 0xFB4F,  # Alphabetic_Presentation_Forms
+    0xFB50, 0xFDFF,  # Arabic_Presentation_Forms_A
+    0xFE00, 0xFE0F,  # Variation_Selectors
+    0xFE10, 0xFE1F,  # Vertical_Forms
+    0xFE20, 0xFE2F,  # Combining_Half_Marks
+    0xFE30, 0xFE4F,  # CJK_Compatibility_Forms
+    0xFE50, 0xFE6F,  # Small_Form_Variants
+    0xFE70, 0xFEFF,  # Arabic_Presentation_Forms_B
+    0xFF00, 0xFFEF,  # Halfwidth_Fullwidth
+    0xFFF0, 0xFFFF,  # Specials
+))
+
+
+def iter_ranges():
+    """Iterate the Unicode range table.
+
+    Yields:
+        Tuples of (name, start, end).
+    """
+    for i, name in enumerate(RANGE_NAMES):
+        yield name, RANGE_BOUNDS[2 * i], RANGE_BOUNDS[2 * i + 1]
+
+
+def range_bucket(range_name):
+    """Map a Unicode range name to its output bucket directory.
+
+    Must agree with range_bucket() in extract_font_universal.py.
+
+    Args:
+        range_name: Unicode range name (e.g. "CJK_Unified")
+
+    Returns:
+        Two-digit hex bucket name.
+    """
+    return hashlib.blake2b(range_name.encode(), digest_size=1).hexdigest()
+
+
+def _validate_ranges():
+    """Check the hand-maintained range table for copy-paste errors.
+
+    Raises:
+        ValueError: If the tables disagree in length, a name repeats, a range
+            is inverted, or two ranges overlap.
+    """
+    if len(RANGE_BOUNDS) != 2 * len(RANGE_NAMES):
+        raise ValueError(f"RANGE_BOUNDS has {len(RANGE_BOUNDS)} values for {len(RANGE_NAMES)} names")
+    if len(set(RANGE_NAMES)) != len(RANGE_NAMES):
+        raise ValueError("Duplicate name in RANGE_NAMES")
+
+    prev_name, prev_end = None, -1
+    for name, start, end in sorted(iter_ranges(), key=lambda r: r[1]):
+        if start > end:
+            raise ValueError(f"Inverted range {name}: 0x{start:04X} > 0x{end:04X}")
+        if start <= prev_end:
+            raise ValueError(f"Range {name} overlaps {prev_name}")
+        prev_name, prev_end = name, end
+
+
+_validate_ranges()
+
+# Bucket directories used by the range table, pre-created before each child runs
+RANGE_BUCKETS = sorted({range_bucket(name) for name in RANGE_NAMES})
+
+
+# Contents of the --ranges-file passed to the child extractor; identical for every firmware
+RANGES_TSV = ''.join(f'{name}\t0x{start:04x}\t0x{end:04x}\n' for name, start, end in iter_ranges())
+
+
+def _is_firmware_image(entry):
+    """Check whether a directory entry looks like a HIFIEC*.IMG firmware file."""
+    return entry.name.startswith('HIFIEC') and entry.name.endswith('.IMG') and entry.is_file()
+
+
+def _scandir(path):
+    """List a directory, treating a missing directory as empty."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except FileNotFoundError:
+        return []
+
+
+def find_firmwares(root='firmwares'):
+    """Discover firmware images one or two levels below each version directory.
+
+    Matches firmwares/<version>/HIFIEC*.IMG and firmwares/<version>/*/HIFIEC*.IMG
+    in a single walk, relying on the dirent type cache instead of extra stat calls.
+
+    Args:
+        root: Directory containing one subdirectory per firmware version
+
+    Yields:
+        Tuples of (version, firmware_path).
+    """
+    for top in _scandir(root):
+        if top.name.startswith('.') or not top.is_dir():
+            continue
+        for mid in _scandir(top.path):
+            if _is_firmware_image(mid):
+                yield top.name, mid.path
+            elif not mid.name.startswith('.') and mid.is_dir():
+                for leaf in _scandir(mid.path):
+                    if _is_firmware_image(leaf):
+                        yield top.name, leaf.path
+
+
+def _stat(path):
+    """Return os.stat for a path, caching the result."""
+    st = _stat_cache.get(path)
+    if st is None:
+        st = _stat_cache[path] = os.stat(path)
+    return st
+
+
+def _disk_order(job):
+    """Sort key placing firmwares in on-disk (device, inode) order."""
+    version, fw_path = job
+    st = _stat(fw_path)
+    return st.st_dev, st.st_ino, version
+
+
+def fingerprint(path, rehash=False):
+    """Compute a cache key for a firmware file.
+
+    By default uses size and modification time, which needs no file read.
+
+    Args:
+        path: Path to firmware .IMG file
+        rehash: If True, hash the file contents with BLAKE2b instead
+
+    Returns:
+        Fingerprint string suitable for use in a file name.
+    """
+    if rehash:
+        digest = _hash_cache.get(path)
+        if digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+            digest = _hash_cache[path] = h.hexdigest()
+        return digest
+
+    st = _stat(path)
+    return f"{st.st_size}-{st.st_mtime_ns}"
+
+
+def _is_populated(path):
+    """Check whether a directory exists and contains at least one entry."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+
+
+def _spawn(cmd, log_fd):
+    """Start cmd with stdout and stderr redirected to log_fd.
+
+    Uses os.posix_spawn where available, which needs no pipes or reader
+    threads; elsewhere falls back to subprocess.
+
+    Returns:
+        Callable that waits for the child and returns its exit code, and a
+        callable that kills it. The kill callable may be called from another
+        thread at any time, including after the child has been reaped.
+    """
+    if hasattr(os, 'posix_spawn') and hasattr(os, 'waitid'):
+        pid = os.posix_spawn(cmd[0], cmd, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, log_fd, 1),
+            (os.POSIX_SPAWN_DUP2, log_fd, 2),
+        ])
+        lock = threading.Lock()
+        reaped = False
+
+        def wait():
+            nonlocal reaped
+            # Wait without reaping: the exited child keeps its PID, so a
+            # concurrent kill() can never signal a recycled one
+            os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+            with lock:
+                reaped = True
+                return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+
+        def kill():
+            with lock:
+                if not reaped:
+                    os.kill(pid, signal.SIGKILL)
+
+        return wait, kill
+
+    proc = subprocess.Popen(cmd, stdout=log_fd, stderr=subprocess.STDOUT)
+    return proc.wait, proc.kill
+
+
+def parse_batch_log(log_path):
+    """Attribute counts and exit statuses in an extractor --batch log.
+
+    Args:
+        log_path: Path to the combined stdout/stderr log
+
+    Returns:
+        Dictionary mapping the batch file index of each started firmware to
+        its 'SMALL'/'LARGE' counts, its 'rc' once finished, and the 'tail'
+        (last 200 characters) of its output for error reporting. Indices
+        rather than versions are used because two images may share a version.
+    """
+    sections = {}
+    if os.path.getsize(log_path) == 0:
+        return sections
+
+    with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+        current = None
+        body_start = 0
+        for m in _LOG_RE.finditer(log):
+            if m.group('job') is not None:
+                current = {'SMALL': 0, 'LARGE': 0, 'tail': ''}
+                sections[int(m.group('job'))] = current
+                body_start = m.end()
+            elif current is None:
+                continue
+            elif m.group('rc') is not None:
+                current['rc'] = int(m.group('rc'))
+                current['tail'] = log[max(body_start, m.start() - 200):m.start()].decode('utf-8', errors='replace')
+                current = None
+            else:
+                current[m.group('size').decode()] = int(m.group('count'))
+
+        if current is not None:
+            current['tail'] = log[max(body_start, len(log) - 200):].decode('utf-8', errors='replace')
+
+    return sections
+
+
+def _run_extractor(cmd, timeout, log_path):
+    """Run the extractor in batch mode and parse its log once it exits.
+
+    Child output goes straight to a log file, so the parent manages no
+    pipes and can never block on a chatty child.
+
+    Args:
+        cmd: Command line to execute
+        timeout: Seconds after which the child is killed
+        log_path: File receiving the child's stdout and stderr
+
+    Returns:
+        Tuple of (return code, sections, timed out flag); see parse_batch_log
+        for the layout of sections.
+    """
+    expired = threading.Event()
+
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        wait, kill = _spawn(cmd, log_fd)
+    finally:
+        os.close(log_fd)
+
+    def expire():
+        expired.set()
+        kill()
+
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    try:
+        returncode = wait()
+    finally:
+        timer.cancel()
+
+    return returncode, parse_batch_log(log_path), expired.is_set()
+
 
-# Comprehensive Unicode range definitions covering all major scripts and symbols
-UNICODE_RANGES = [
-    ("Basic_Latin", 0x0000, 0x007F),
-    ("Latin_1_Supplement", 0x0080, 0x00FF),
-    ("Latin_Extended_A", 0x0100, 0x017F),
-    ("Latin_Extended_B", 0x0180, 0x024F),
-    ("IPA_Extensions", 0x0250, 0x02AF),
-    ("Spacing_Modifier", 0x02B0, 0x02FF),
-    ("Combining_Diacritics", 0x0300, 0x036F),
-    ("Greek_Coptic", 0x0370, 0x03FF),
-    ("Cyrillic", 0x0400, 0x04FF),
-    ("Cyrillic_Supplement", 0x0500, 0x052F),
-    ("Armenian", 0x0530, 0x058F),
-    ("Hebrew", 0x0590, 0x05FF),
-    ("Arabic", 0x0600, 0x06FF),
-    ("Syriac", 0x0700, 0x074F),
-    ("Arabic_Supplement", 0x0750, 0x077F),
-    ("Thaana", 0x0780, 0x07BF),
-    ("NKo", 0x07C0, 0x07FF),
-    ("Samaritan", 0x0800, 0x083F),
-    ("Mandaic", 0x0840, 0x085F),
-    ("Arabic_Extended_B", 0x0870, 0x089F),
-    ("Arabic_Extended_A", 0x08A0, 0x08FF),
-    ("Devanagari", 0x0900, 0x097F),
-    ("Bengali", 0x0980, 0x09FF),
-    ("Gurmukhi", 0x0A00, 0x0A7F),
-    ("Gujarati", 0x0A80, 0x0AFF),
-    ("Oriya", 0x0B00, 0x0B7F),
-    ("Tamil", 0x0B80, 0x0BFF),
-    ("Telugu", 0x0C00, 0x0C7F),
-    ("Kannada", 0x0C80, 0x0CFF),
-    ("Malayalam", 0x0D00, 0x0D7F),
-    ("Sinhala", 0x0D80, 0x0DFF),
-    ("Thai", 0x0E00, 0x0E7F),
-    ("Lao", 0x0E80, 0x0EFF),
-    ("Tibetan", 0x0F00, 0x0FFF),
-    ("Myanmar", 0x1000, 0x109F),
-    ("Georgian", 0x10A0, 0x10FF),
-    ("Hangul_Jamo", 0x1100, 0x11FF),
-    ("Ethiopic", 0x1200, 0x137F),
-    ("Ethiopic_Supplement", 0x1380, 0x139F),
-    ("Cherokee", 0x13A0, 0x13FF),
-    ("UCAS", 0x1400, 0x167F),
-    ("Ogham", 0x1680, 0x169F),
-    ("Runic", 0x16A0, 0x16FF),
-    ("Tagalog", 0x1700, 0x171F),
-    ("Hanunoo", 0x1720, 0x173F),
-    ("Buhid", 0x1740, 0x175F),
-    ("Tagbanwa", 0x1760, 0x177F),
-    ("Khmer", 0x1780, 0x17FF),
-    ("Mongolian", 0x1800, 0x18AF),
-    ("UCAS_Extended", 0x18B0, 0x18FF),
-    ("Limbu", 0x1900, 0x194F),
-    ("Tai_Le", 0x1950, 0x197F),
-    ("New_Tai_Lue", 0x1980, 0x19DF),
-    ("Khmer_Symbols", 0x19E0, 0x19FF),
-    ("Buginese", 0x1A00, 0x1A1F),
-    ("Tai_Tham", 0x1A20, 0x1AAF),
-    ("Balinese", 0x1B00, 0x1B7F),
-    ("Sundanese", 0x1B80, 0x1BBF),
-    ("Batak", 0x1BC0, 0x1BFF),
-    ("Lepcha", 0x1C00, 0x1C4F),
-    ("Ol_Chiki", 0x1C50, 0x1C7F),
-    ("Cyrillic_Extended_C", 0x1C80, 0x1C8F),
-    ("Georgian_Extended", 0x1C90, 0x1CBF),
-    ("Vedic_Extensions", 0x1CD0, 0x1CFF),
-    ("Phonetic_Extensions", 0x1D00, 0x1D7F),
-    ("Phonetic_Extensions_Sup", 0x1D80, 0x1DBF),
-    ("Combining_Diacritics_Sup", 0x1DC0, 0x1DFF),
-    ("Latin_Extended_Additional", 0x1E00, 0x1EFF),
-    ("Greek_Extended", 0x1F00, 0x1FFF),
-    ("General_Punctuation", 0x2000, 0x206F),
-    ("Superscripts_Subscripts", 0x2070, 0x209F),
-    ("Currency_Symbols", 0x20A0, 0x20CF),
-    ("Combining_Diacritics_Sym", 0x20D0, 0x20FF),
-    ("Letterlike_Symbols", 0x2100, 0x214F),
-    ("Number_Forms", 0x2150, 0x218F),
-    ("Arrows", 0x2190, 0x21FF),
-    ("Mathematical_Operators", 0x2200, 0x22FF),
-    ("Misc_Technical", 0x2300, 0x23FF),
-    ("Control_Pictures", 0x2400, 0x243F),
-    ("OCR", 0x2440, 0x245F),
-    ("Enclosed_Alphanumerics", 0x2460, 0x24FF),
-    ("Box_Drawing", 0x2500, 0x257F),
-    ("Block_Elements", 0x2580, 0x259F),
-    ("Geometric_Shapes", 0x25A0, 0x25FF),
-    ("Misc_Symbols", 0x2600, 0x26FF),
-    ("Dingbats", 0x2700, 0x27BF),
-    ("Misc_Math_Symbols_A", 0x27C0, 0x27EF),
-    ("Supplemental_Arrows_A", 0x27F0, 0x27FF),
-    ("Braille_Patterns", 0x2800, 0x28FF),
-    ("Supplemental_Arrows_B", 0x2900, 0x297F),
-    ("Misc_Math_Symbols_B", 0x2980, 0x29FF),
-    ("Supplemental_Math_Op", 0x2A00, 0x2AFF),
-    ("Misc_Symbols_Arrows", 0x2B00, 0x2BFF),
-    ("Glagolitic", 0x2C00, 0x2C5F),
-    ("Latin_Extended_C", 0x2C60, 0x2C7F),
-    ("Coptic", 0x2C80, 0x2CFF),
-    ("Georgian_Supplement", 0x2D00, 0x2D2F),
-    ("Tifinagh", 0x2D30, 0x2D7F),
-    ("Ethiopic_Extended", 0x2D80, 0x2DDF),
-    ("Cyrillic_Extended_A", 0x2DE0, 0x2DFF),
-    ("Supplemental_Punctuation", 0x2E00, 0x2E7F),
-    ("CJK_Radicals_Sup", 0x2E80, 0x2EFF),
-    ("Kangxi_Radicals", 0x2F00, 0x2FDF),
-    ("Ideographic_Description", 0x2FF0, 0x2FFF),
-    ("CJK_Symbols_Punctuation", 0x3000, 0x303F),
-    ("Hiragana", 0x3040, 0x309F),
-    ("Katakana", 0x30A0, 0x30FF),
-    ("Bopomofo", 0x3100, 0x312F),
-    ("Hangul_Compatibility", 0x3130, 0x318F),
-    ("Kanbun", 0x3190, 0x319F),
-    ("Bopomofo_Extended", 0x31A0, 0x31BF),
-    ("CJK_Strokes", 0x31C0, 0x31EF),
-    ("Katakana_Phonetic", 0x31F0, 0x31FF),
-    ("Enclosed_CJK", 0x3200, 0x32FF),
-    ("CJK_Compatibility", 0x3300, 0x33FF),
-    ("CJK_Extension_A", 0x3400, 0x4DBF),
-    ("Yijing_Hexagrams", 0x4DC0, 0x4DFF),
-    ("CJK_Unified", 0x4E00, 0x9FFF),
-    ("Yi_Syllables", 0xA000, 0xA48F),
-    ("Yi_Radicals", 0xA490, 0xA4CF),
-    ("Lisu", 0xA4D0, 0xA4FF),
-    ("Vai", 0xA500, 0xA63F),
-    ("Cyrillic_Extended_B", 0xA640, 0xA69F),
-    ("Bamum", 0xA6A0, 0xA6FF),
-    ("Modifier_Tone_Letters", 0xA700, 0xA71F),
-    ("Latin_Extended_D", 0xA720, 0xA7FF),
-    ("Syloti_Nagri", 0xA800, 0xA82F),
-    ("Indic_Number_Forms", 0xA830, 0xA83F),
-    ("Phags_pa", 0xA840, 0xA87F),
-    ("Saurashtra", 0xA880, 0xA8DF),
-    ("Devanagari_Extended", 0xA8E0, 0xA8FF),
-    ("Kayah_Li", 0xA900, 0xA92F),
-    ("Rejang", 0xA930, 0xA95F),
-    ("Hangul_Jamo_Extended_A", 0xA960, 0xA97F),
-    ("Javanese", 0xA980, 0xA9DF),
-    ("Myanmar_Extended_B", 0xA9E0, 0xA9FF),
-    ("Cham", 0xAA00, 0xAA5F),
-    ("Myanmar_Extended_A", 0xAA60, 0xAA7F),
-    ("Tai_Viet", 0xAA80, 0xAADF),
-    ("Meetei_Mayek_Ext", 0xAAE0, 0xAAFF),
-    ("Ethiopic_Extended_A", 0xAB00, 0xAB2F),
-    ("Latin_Extended_E", 0xAB30, 0xAB6F),
-    ("Cherokee_Supplement", 0xAB70, 0xABBF),
-    ("Meetei_Mayek", 0xABC0, 0xABFF),
-    ("Hangul_Syllables", 0xAC00, 0xD7AF),
-    ("Hangul_Jamo_Extended_B", 0xD7B0, 0xD7FF),
-    ("Private_Use_Area", 0xE000, 0xF8FF),
-    ("CJK_Compatibility_Ideographs", 0xF900, 0xFAFF),
-    ("Alphabetic_Presentation_Forms", 0xFB00, 0xFB4F),
-    ("Arabic_Presentation_Forms_A", 0xFB50, 0xFDFF),
-    ("Variation_Selectors", 0xFE00, 0xFE0F),
-    ("Vertical_Forms", 0xFE10, 0xFE1F),
-    ("Combining_Half_Marks", 0xFE20, 0xFE2F),
-    ("CJK_Compatibility_Forms", 0xFE30, 0xFE4F),
-    ("Small_Form_Variants", 0xFE50, 0xFE6F),
-    ("Arabic_Presentation_Forms_B", 0xFE70, 0xFEFF),
-    ("Halfwidth_Fullwidth", 0xFF00, 0xFFEF),
-    ("Specials", 0xFFF0, 0xFFFF),
-]
-
-firmware_dirs = []
-for path in glob.glob('firmwares/*/HIFIEC*.IMG'):
-    dir_name = os.path.basename(os.path.dirname(path))
-    firmware_dirs.append((dir_name, path))
-
-for path in glob.glob('firmwares/*/*/HIFIEC*.IMG'):
-    dir_name = os.path.basename(os.path.dirname(os.path.dirname(path)))
-    firmware_dirs.append((dir_name, path))
-
-firmware_dirs = sorted(set(firmware_dirs))
-
-print("=" * 80)
-print(f"Batch Font Extraction for All Versions")
-print(f"Found {len(firmware_dirs)} firmware versions")
-print("=" * 80)
-print()
-
-results = []
-
-for version, fw_path in firmware_dirs:
-    print(f"\nProcessing: {version}")
-    print(f"  Firmware: {fw_path}")
+def _cache_path(version, fw_path, rehash=False):
+    """Return the result cache file for a firmware."""
+    return os.path.join(CACHE_DIR, f"{version}-{fingerprint(fw_path, rehash)}.json")
 
+
+def _write_cache(cache_path, counts):
+    """Write a result cache file atomically.
+
+    The JSON goes to a temporary file in CACHE_DIR that is then renamed over
+    cache_path, so an interrupted run never leaves a truncated cache behind.
+
+    Args:
+        cache_path: Result cache file (see _cache_path)
+        counts: Dictionary with 'small' and 'large' counts
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(counts, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_done_counts(output_dir, key):
+    """Read counts recorded by the extractor's completion marker.
+
+    Args:
+        output_dir: Output directory for the firmware
+        key: Firmware fingerprint used as the sentinel tag
+
+    Returns:
+        Dictionary with 'small' and 'large' counts, or None if the sentinel
+        for this fingerprint is missing or counts.txt is missing or malformed.
+    """
+    if not os.path.exists(os.path.join(output_dir, f'.done_{key}')):
+        return None
+
+    counts = {}
+    try:
+        with open(os.path.join(output_dir, 'counts.txt')) as f:
+            for line in f:
+                name, _, value = line.strip().partition('=')
+                counts[name.lower()] = int(value)
+    except (OSError, ValueError):
+        # Sentinel without usable counts (cleaned up or partially copied)
+        return None
+    return {'small': counts.get('small', 0), 'large': counts.get('large', 0)}
+
+
+def clear_done_markers(output_dir):
+    """Remove every .done_* sentinel from a firmware's output directory."""
+    for entry in _scandir(output_dir):
+        if entry.name.startswith('.done_'):
+            os.unlink(entry.path)
+
+
+def lookup_cached(version, fw_path, force=False, rehash=False):
+    """Look up a cached extraction result for a firmware.
+
+    The .done_<fingerprint> sentinel in the output directory is checked
+    first, then the JSON result cache.
+
+    Args:
+        version: Firmware version name (used as output subdirectory)
+        fw_path: Path to firmware .IMG file
+        force: If True, ignore any cached result
+        rehash: If True, fingerprint by file content instead of size/mtime
+
+    Returns:
+        Tuple of (result dictionary, log text) on a cache hit, else None.
+    """
     output_dir = os.path.join(OUTPUT_BASE, version)
 
-    ranges_args = []
-    for name, start, end in UNICODE_RANGES:
-        ranges_args.extend([f"--range", f"{name}:{hex(start)}:{hex(end)}"])
+    if force:
+        return None
+
+    cached = _read_done_counts(output_dir, fingerprint(fw_path, rehash))
+
+    if cached is None:
+        cache_path = _cache_path(version, fw_path, rehash)
+        if not os.path.isfile(cache_path) or not _is_populated(output_dir):
+            return None
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            cached = {'small': cached['small'], 'large': cached['large']}
+        except (OSError, ValueError, KeyError, TypeError):
+            # Truncated or malformed cache file: extract again
+            return None
+
+    log = [
+        f"\nProcessing: {version}",
+        f"  Firmware: {fw_path}",
+        f"  💾 Cached: SMALL={cached['small']}, LARGE={cached['large']}",
+    ]
+    entry = {
+        'version': version,
+        'status': '💾',
+        'small': cached['small'],
+        'large': cached['large']
+    }
+    return entry, '\n'.join(log)
+
+
+def firmware_timeout(path):
+    """Choose an extraction timeout for a firmware based on its size.
+
+    Args:
+        path: Path to firmware .IMG file
+
+    Returns:
+        Timeout in seconds.
+    """
+    size_mb = _stat(path).st_size / (1 << 20)
+    return max(MIN_TIMEOUT, min(MAX_TIMEOUT, int(size_mb * TIMEOUT_PER_MB)))
+
+
+def sniff(path):
+    """Cheaply check that a file looks like a usable firmware image.
+
+    Reads only the image header with a single pread and checks that the
+    part_2_firmware_b partition entry at 0x80, which the font extractor
+    depends on, describes a non-empty region inside the file.
+
+    Args:
+        path: Path to candidate firmware .IMG file
+
+    Returns:
+        None if the file looks valid, else a short reason for rejecting it.
+    """
+    size = _stat(path).st_size
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        header = os.pread(fd, 0x90, 0)
+    finally:
+        os.close(fd)
+
+    if len(header) < 0x90:
+        return f"truncated ({size} bytes)"
+
+    offset, part_size = struct.unpack_from('<II', header, 0x80)
+    if part_size == 0 or offset + part_size > size:
+        return f"bad partition table (offset=0x{offset:X}, size=0x{part_size:X}, file=0x{size:X})"
+
+    return None
+
+
+def run_shard(index, jobs, ranges_path, rehash=False):
+    """Run one extractor process over a shard of firmwares.
+
+    Output is buffered per firmware and returned rather than printed so
+    that logs from concurrently running workers do not interleave.
+    Successful results are written to the cache.
+
+    The child's full output is kept in <OUTPUT_BASE>/.logs/shard_<index>.log,
+    and it is allowed the sum of its firmwares' timeouts.
+
+    Args:
+        index: Shard number, used to name the log file
+        jobs: List of (version, fw_path) tuples
+        ranges_path: Path to the shared Unicode ranges file
+        rehash: If True, fingerprint by file content instead of size/mtime
+
+    Returns:
+        List of (result dictionary, buffered log text) tuples, one per job.
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for version, fw_path in jobs:
+            # The child writes .done_<fingerprint> once this firmware completes
+            f.write(f"{version}\t{fw_path}\t{fingerprint(fw_path, rehash)}\n")
+        batch_path = f.name
 
     cmd = [
         sys.executable,
         'extract_font_universal.py',
-        fw_path,
-        '-o', output_dir,
-        *ranges_args
+        '--batch', batch_path,
+        '--ranges-file', ranges_path,
+        '--bucket-hash',
+        '-o', OUTPUT_BASE
     ]
 
-    print(f"  Output: {output_dir}")
-    print(f"  Command: {' '.join(cmd[:3])} ...")
+    for version, _ in jobs:
+        clear_done_markers(os.path.join(OUTPUT_BASE, version))
+        for size in ('SMALL', 'LARGE'):
+            for bucket in RANGE_BUCKETS:
+                os.makedirs(os.path.join(OUTPUT_BASE, version, size, bucket), exist_ok=True)
+
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_path = os.path.join(LOG_DIR, f'shard_{index}.log')
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-
-        if result.returncode == 0:
-            output_lines = result.stdout.split('\n')
-            small_count = 0
-            large_count = 0
-
-            for line in output_lines:
-                if 'SMALL:' in line and 'extracted' in line:
-                    try:
-                        small_count = int(line.split('SMALL:')[1].split('fonts')[0].strip())
-                    except:
-                        pass
-                if 'LARGE:' in line and 'extracted' in line:
-                    try:
-                        large_count = int(line.split('LARGE:')[1].split('fonts')[0].strip())
-                    except:
-                        pass
-
-            print(f"  ✅ Success: SMALL={small_count}, LARGE={large_count}")
-            results.append({
-                'version': version,
-                'status': '✅',
-                'small': small_count,
-                'large': large_count
-            })
+        timeout = sum(firmware_timeout(fw_path) for _, fw_path in jobs)
+        returncode, sections, timed_out = _run_extractor(cmd, timeout, log_path)
+    finally:
+        os.unlink(batch_path)
+
+    outcomes = []
+    for job_index, (version, fw_path) in enumerate(jobs):
+        log = [
+            f"\nProcessing: {version}",
+            f"  Firmware: {fw_path}",
+            f"  Output: {os.path.join(OUTPUT_BASE, version)}",
+            f"  Command: {' '.join(cmd[:3])} ...",
+            f"  Timeout: {firmware_timeout(fw_path)} s",
+        ]
+        section = sections.get(job_index, {})
+        rc = section.get('rc')
+
+        if rc == 0:
+            small_count = section['SMALL']
+            large_count = section['LARGE']
+
+            log.append(f"  ✅ Success: SMALL={small_count}, LARGE={large_count}")
+            _write_cache(_cache_path(version, fw_path, rehash), {'small': small_count, 'large': large_count})
+            status = '✅'
+        elif rc is None and timed_out:
+            log.append(f"  ⏰ Timeout")
+            small_count = large_count = 0
+            status = '⏰'
         else:
-            print(f"  ❌ Failed: {result.returncode}")
-            print(f"  Error: {result.stderr[:200]}")
-            results.append({
-                'version': version,
-                'status': '❌',
-                'small': 0,
-                'large': 0
-            })
-
-    except subprocess.TimeoutExpired:
-        print(f"  ⏰ Timeout")
-        results.append({
+            log.append(f"  ❌ Failed: {rc if rc is not None else returncode}")
+            log.append(f"  Error: {section.get('tail', '')}")
+            log.append(f"  Log: {log_path}")
+            small_count = large_count = 0
+            status = '❌'
+
+        entry = {
             'version': version,
-            'status': '⏰',
-            'small': 0,
-            'large': 0
-        })
-
-print()
-print("=" * 80)
-print("Batch Extraction Complete")
-print("=" * 80)
-print()
-print(f"{'Version':<25} {'Status':<5} {'SMALL':<10} {'LARGE':<10}")
-print("-" * 60)
-
-total_small = 0
-total_large = 0
-success_count = 0
-
-for r in results:
-    print(f"{r['version']:<25} {r['status']:<5} {r['small']:<10} {r['large']:<10}")
-    total_small += r['small']
-    total_large += r['large']
-    if r['status'] == '✅':
-        success_count += 1
-
-print("-" * 60)
-print(f"Total: {success_count}/{len(results)} successful")
-print(f"Total extracted: SMALL={total_small}, LARGE={total_large}")
-print(f"Output directory: {OUTPUT_BASE}/")
+            'status': status,
+            'small': small_count,
+            'large': large_count
+        }
+        outcomes.append((entry, '\n'.join(log)))
+
+    return outcomes
+
+
+def main():
+    """Main entry point: discover firmwares and extract fonts from each in parallel."""
+    parser = argparse.ArgumentParser(description='Batch Font Extractor - Process All Firmware Versions')
+    parser.add_argument('--force', action='store_true',
+                        help='Ignore cached results, remove .done_* sentinels and re-extract every firmware')
+    parser.add_argument('--rehash', action='store_true',
+                        help='Fingerprint firmwares by content hash instead of size/mtime')
+    args = parser.parse_args()
+
+    # Block-buffer stdout: output is flushed once per completed shard instead of per line
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
+
+    # Discovery runs in a background thread; the stat and cache checks for
+    # each firmware overlap with the walk for the next one.
+    discovered = queue.Queue()
+    discovery_errors = []
+
+    def discover():
+        try:
+            for job in find_firmwares():
+                discovered.put(job)
+        except Exception as e:
+            discovery_errors.append(e)
+        finally:
+            discovered.put(None)
+
+    threading.Thread(target=discover, daemon=True).start()
+
+    seen = set()
+    cached = {}
+    rejected = []
+    while True:
+        job = discovered.get()
+        if job is None:
+            break
+        if job in seen:
+            continue
+        seen.add(job)
+        version, fw_path = job
+        reason = sniff(fw_path)
+        if reason is not None:
+            rejected.append((fw_path, reason))
+            continue
+        if args.force:
+            clear_done_markers(os.path.join(OUTPUT_BASE, version))
+        hit = lookup_cached(version, fw_path, args.force, args.rehash)
+        if hit is not None:
+            cached[job] = hit
+
+    if discovery_errors:
+        raise discovery_errors[0]
+
+    # Inode order keeps opens mostly sequential on rotational storage
+    rejected_paths = {fw_path for fw_path, _ in rejected}
+    firmware_dirs = sorted((job for job in seen if job[1] not in rejected_paths), key=_disk_order)
+
+    print("=" * 80)
+    print(f"Batch Font Extraction for All Versions")
+    print(f"Found {len(firmware_dirs)} firmware versions")
+    for fw_path, reason in sorted(rejected):
+        print(f"  ⛔ Skipping {fw_path}: {reason}")
+    print("=" * 80)
+    print()
+
+    results = []
+    pending = []
+
+    for job in firmware_dirs:
+        if job in cached:
+            entry, log = cached[job]
+            print(log)
+            results.append(entry)
+        else:
+            pending.append(job)
+
+    if pending:
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False) as f:
+            f.write(RANGES_TSV)
+            ranges_path = f.name
+
+        try:
+            # One extractor process per worker amortizes interpreter startup over
+            # its shard; the work is out-of-process, so threads are enough.
+            # Shards are contiguous so each worker reads neighbouring inodes.
+            # Images of one version share its output directory, so they are
+            # kept in the same shard and extracted one after another.
+            by_version = {}
+            for job in pending:
+                by_version.setdefault(job[0], []).append(job)
+            groups = list(by_version.values())
+            workers = min(len(groups), os.cpu_count() or 1)
+            shards = [[job for group in groups[i * len(groups) // workers:(i + 1) * len(groups) // workers]
+                       for job in group]
+                      for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run_shard, i, shard, ranges_path, args.rehash)
+                           for i, shard in enumerate(shards)]
+                for future in as_completed(futures):
+                    for entry, log in future.result():
+                        print(log)
+                        results.append(entry)
+                    sys.stdout.flush()
+        finally:
+            os.unlink(ranges_path)
+
+    results.sort(key=lambda r: r['version'])
+
+    total_small = 0
+    total_large = 0
+    success_count = 0
+
+    rows = [
+        "",
+        "=" * 80,
+        "Batch Extraction Complete",
+        "=" * 80,
+        "",
+        f"{'Version':<25} {'Status':<5} {'SMALL':<10} {'LARGE':<10}",
+        "-" * 60,
+    ]
+
+    for r in results:
+        rows.append(f"{r['version']:<25} {r['status']:<5} {r['small']:<10} {r['large']:<10}")
+        total_small += r['small']
+        total_large += r['large']
+        if r['status'] in ('✅', '💾'):
+            success_count += 1
+
+    rows.append("-" * 60)
+    rows.append(f"Total: {success_count}/{len(results)} successful")
+    rows.append(f"Total extracted: SMALL={total_small}, LARGE={total_large}")
+    rows.append(f"Output directory: {OUTPUT_BASE}/")
+    sys.stdout.write('\n'.join(rows) + '\n')
+
+    # Identifies the exact firmware set this summary describes
+    firmware_fingerprint = hashlib.blake2b(
+        '|'.join(f"{fw_path}:{fingerprint(fw_path, args.rehash)}" for _, fw_path in sorted(firmware_dirs)).encode()
+    ).hexdigest()
+
+    os.makedirs(OUTPUT_BASE, exist_ok=True)
+    with open(RESULTS_JSON, 'w') as f:
+        json.dump({
+            'results': results,
+            'total_small': total_small,
+            'total_large': total_large,
+            'success': success_count,
+            'firmware_fingerprint': firmware_fingerprint
+        }, f, indent=2, ensure_ascii=False)
+    print(f"Summary JSON: {RESULTS_JSON}")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
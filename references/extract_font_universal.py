@@ -26,7 +26,86 @@ Font Format:
 
 import struct
 import os
+import mmap
+import re
+import sys
+import hashlib
+import functools
+import heapq
 import argparse
+import contextlib
+import io
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import compress, repeat
+
+
+# Precompiled layouts for fixed firmware fields, unpacked in place
+_PARTITION_ENTRY = struct.Struct('<IIII')
+_CONFIG_WORDS = struct.Struct('<HH')
+_U16 = struct.Struct('<H')
+
+_ANOMALY_AS_SIGNATURE = bytes.maketrans(b'2', b'1')
+
+# Blank (erased or zeroed) SMALL and LARGE font entries
+_ZEROS_32 = b'\x00' * 32
+_ONES_32 = b'\xFF' * 32
+_ZEROS_33 = b'\x00' * 33
+_ONES_33 = b'\xFF' * 33
+
+
+@functools.lru_cache(maxsize=None)
+def _footer_class_table(footer_signatures):
+    """Build the 256-entry footer classification table for bytes.translate.
+
+    Args:
+        footer_signatures: Frozenset of valid footer byte values
+
+    Returns:
+        Table mapping each byte to b'0' (invalid: 0x00, 0xFF), b'1'
+        (signature) or b'2' (anomaly).
+    """
+    classes = bytearray(b'2' * 256)
+    for value in footer_signatures:
+        classes[value] = ord('1')
+    for value in (0x00, 0xFF):
+        classes[value] = ord('0')
+    return bytes(classes)
+
+
+def _scan_runs(footer_classes, max_anomalies):
+    """Find the longest anomaly-tolerant run of classified footer bytes.
+
+    A run is broken by an invalid footer, or by the anomaly that exceeds
+    max_anomalies consecutive anomalies (which does not join either run).
+
+    Args:
+        footer_classes: Classified footers (b'0' invalid, b'1' signature, b'2' anomaly)
+        max_anomalies: Maximum consecutive anomalies tolerated inside a run
+
+    Returns:
+        Tuple of (run_length, run_start_index), or (0, 0) if there is no run.
+    """
+    footer_classes = footer_classes.replace(
+        b'2' * (max_anomalies + 1), b'2' * max_anomalies + b'0'
+    ).translate(_ANOMALY_AS_SIGNATURE)
+
+    run_length = max(map(len, footer_classes.split(b'0')))
+    if run_length == 0:
+        return 0, 0
+    return run_length, footer_classes.find(b'1' * run_length)
+
+
+@functools.lru_cache(maxsize=1)
+def _v310_reference():
+    """Read the first 5 LARGE font entries of the V3.1.0 reference firmware.
+
+    Returns:
+        Reference bytes (5 entries x 33 bytes).
+    """
+    with open('firmwares/ECHO MINI V3.1.0/HIFIEC10.IMG', 'rb') as f:
+        f.seek(0x4273CA)
+        return f.read(5 * 33)
 
 
 class FirmwareAnalyzer:
@@ -37,15 +116,27 @@ class FirmwareAnalyzer:
     pattern recognition and statistical analysis.
     """
 
-    def __init__(self, firmware_path):
+    def __init__(self, firmware_path, search_workers=1):
         """Initialize analyzer with firmware image.
 
         Args:
             firmware_path: Path to firmware .IMG file
+            search_workers: Number of processes scoring search windows
+                (1 scores them in this process)
         """
+        # Map the image read-only: scans slice and search the page cache
+        # directly instead of a private copy of the whole file. The mapping
+        # is released when the analyzer is.
         with open(firmware_path, 'rb') as f:
-            self.firmware = f.read()
+            try:
+                self.firmware = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self.firmware = b''
         self.firmware_path = firmware_path
+        self.search_workers = search_workers
+        self._footer_columns = {}
+        self._7e_sequences = {}
 
     def get_firmware_partition(self):
         """Read part_2_firmware_b partition information.
@@ -56,8 +147,7 @@ class FirmwareAnalyzer:
         Returns:
             Dictionary with 'offset' and 'size' of the partition.
         """
-        chunk = self.firmware[0x80:0x80+16]
-        offset, size, next_offset, _ = struct.unpack('<IIII', chunk)
+        offset, size, next_offset, _ = _PARTITION_ENTRY.unpack_from(self.firmware, 0x80)
         return {'offset': offset, 'size': size}
 
     def detect_small_base(self):
@@ -68,11 +158,34 @@ class FirmwareAnalyzer:
         Returns:
             Base address of SMALL font table.
         """
-        config_78 = struct.unpack('<H', self.firmware[0x78:0x7A])[0]
-        config_7A = struct.unpack('<H', self.firmware[0x7A:0x7C])[0]
+        config_78, config_7A = _CONFIG_WORDS.unpack_from(self.firmware, 0x78)
         small_base = (config_7A << 16) | config_78
         return small_base
 
+    def _footer_column(self, alignment, FOOTER_SIGNATURES, LARGE_STRIDE):
+        """Classify the footer byte of every entry on one grid alignment.
+
+        The column is built once per alignment and shared by every window
+        scored on it, across all refinement rounds.
+
+        Args:
+            alignment: Grid alignment (entry address % LARGE_STRIDE)
+            FOOTER_SIGNATURES: Set of valid footer byte values
+            LARGE_STRIDE: Font entry stride (33 bytes)
+
+        Returns:
+            Bytes with one class per entry: b'0' invalid (0x00, 0xFF),
+            b'1' signature, b'2' anomaly. Index k is the entry at
+            alignment + k * LARGE_STRIDE.
+        """
+        classes = _footer_class_table(frozenset(FOOTER_SIGNATURES))
+        key = (alignment, LARGE_STRIDE, classes)
+        column = self._footer_columns.get(key)
+        if column is None:
+            column = self.firmware[alignment + 32::LARGE_STRIDE].translate(classes)
+            self._footer_columns[key] = column
+        return column
+
     def _score_window(self, window_start, window_end, FOOTER_SIGNATURES, LARGE_STRIDE, base_alignment=None):
         """Score a memory window for likelihood of containing font data.
 
@@ -94,57 +207,25 @@ class FirmwareAnalyzer:
         Returns:
             Tuple of (max_sequence_length, sequence_start_address)
         """
-        INVALID_VALUES = {0x00, 0xFF}
+        max_anomalies = 5
 
         max_sequence_length = 0
         max_sequence_start = window_start
 
-        current_length = 0
-        current_start = window_start
-        consecutive_anomalies = 0
-        max_anomalies = 5
-
-        for offset in range(0, window_end - window_start, LARGE_STRIDE):
-            addr = window_start + offset
-
-            if addr + 32 >= len(self.firmware):
-                break
-
-            if base_alignment is not None:
-                if addr % LARGE_STRIDE != base_alignment:
-                    continue
-
-            byte_32 = self.firmware[addr + 32]
-
-            if byte_32 in INVALID_VALUES:
-                if current_length > max_sequence_length:
-                    max_sequence_length = current_length
-                    max_sequence_start = current_start
-                current_length = 0
-                consecutive_anomalies = 0
-            elif byte_32 in FOOTER_SIGNATURES:
-                if current_length == 0:
-                    current_start = addr
-                current_length += 1
-                consecutive_anomalies = 0
-            else:
-                consecutive_anomalies += 1
-
-                if consecutive_anomalies <= max_anomalies:
-                    if current_length == 0:
-                        current_start = addr
-                    current_length += 1
-                else:
-                    if current_length > max_sequence_length:
-                        max_sequence_length = current_length
-                        max_sequence_start = current_start
+        # The window is scanned at its own stride, so every address in it
+        # shares window_start's grid position
+        if base_alignment is not None and window_start % LARGE_STRIDE != base_alignment:
+            return max_sequence_length, max_sequence_start
 
-                    current_length = 0
-                    consecutive_anomalies = 0
+        column = self._footer_column(window_start % LARGE_STRIDE, FOOTER_SIGNATURES, LARGE_STRIDE)
+        first_entry = window_start // LARGE_STRIDE
+        entry_count = len(range(0, window_end - window_start, LARGE_STRIDE))
+        footer_classes = column[first_entry:first_entry + entry_count]
 
-        if current_length > max_sequence_length:
-            max_sequence_length = current_length
-            max_sequence_start = current_start
+        run_length, run_index = _scan_runs(footer_classes, max_anomalies)
+        if run_length > max_sequence_length:
+            max_sequence_length = run_length
+            max_sequence_start = window_start + run_index * LARGE_STRIDE
 
         return max_sequence_length, max_sequence_start
 
@@ -158,7 +239,7 @@ class FirmwareAnalyzer:
             Detected base address of LARGE font table, or None if not found.
         """
         LARGE_STRIDE = 33
-        FOOTER_SIGNATURES = {0x90, 0x8F, 0x89, 0x8B, 0x8D, 0x8E, 0x8C}
+        FOOTER_SIGNATURES = frozenset({0x90, 0x8F, 0x89, 0x8B, 0x8D, 0x8E, 0x8C})
 
         partition = self.get_firmware_partition()
         search_start = partition['offset']
@@ -180,62 +261,88 @@ class FirmwareAnalyzer:
         best_score = -1
         base_alignment = None
 
-        while current_stride > min_stride and current_regions:
-            iteration += 1
-            print(f"\n  Round {iteration} scan (stride: {current_stride} bytes)...")
-
-            if base_alignment is not None:
-                print(f"    Using grid alignment: addr % 33 = {base_alignment}")
-
-            region_results = []
+        # (window_start, window_end, alignment) -> (score, first_addr)
+        window_scores = {}
 
-            for region in current_regions:
-                for window_start in range(region['start'], region['end'], current_stride):
-                    window_end = min(window_start + window_size, len(self.firmware))
-
-                    score, first_addr = self._score_window(
-                        window_start, window_end, FOOTER_SIGNATURES, LARGE_STRIDE, base_alignment
-                    )
+        # Worker processes map the image themselves rather than receiving it
+        pool = None
+        if self.search_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.search_workers, initializer=_init_search_worker,
+                                       initargs=(self.firmware_path,))
 
+        try:
+            while current_stride > min_stride and current_regions:
+                iteration += 1
+                print(f"\n  Round {iteration} scan (stride: {current_stride} bytes)...")
+
+                if base_alignment is not None:
+                    print(f"    Using grid alignment: addr % 33 = {base_alignment}")
+
+                # One list per field, indexed by window
+                window_starts = [window_start for region in current_regions
+                                 for window_start in range(region['start'], region['end'], current_stride)]
+                windows = [(window_start, min(window_start + window_size, len(self.firmware)), base_alignment)
+                           for window_start in window_starts]
+                scores = []
+                first_addrs = []
+
+                # Top windows often share a first address, giving identical
+                # regions, and later rounds revisit earlier windows: score
+                # each distinct window only once per search
+                pending = [window for window in dict.fromkeys(windows) if window not in window_scores]
+                if pending:
+                    pending_starts, pending_ends, pending_alignments = zip(*pending)
+                    if pool is None:
+                        results = map(self._score_window, pending_starts, pending_ends, repeat(FOOTER_SIGNATURES),
+                                      repeat(LARGE_STRIDE), pending_alignments)
+                    else:
+                        chunksize = max(1, -(-len(pending) // self.search_workers))
+                        results = pool.map(_score_window_task, pending_starts, pending_ends,
+                                           repeat(FOOTER_SIGNATURES), repeat(LARGE_STRIDE), pending_alignments,
+                                           chunksize=chunksize)
+                    window_scores.update(zip(pending, results))
+
+                for window in windows:
+                    score, first_addr = window_scores[window]
                     if score > best_score:
                         best_score = score
                         best_addr = first_addr
 
-                    region_results.append({
-                        'window_start': window_start,
-                        'score': score,
-                        'first_addr': first_addr
-                    })
+                    scores.append(score)
+                    first_addrs.append(first_addr)
 
-            region_results.sort(key=lambda x: x['score'], reverse=True)
-            top_windows = region_results[:5]
+                # Same order as a stable descending sort, without sorting every window
+                top_windows = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
 
-            print(f"    Found {len(region_results)} windows, keeping top 5")
-            for i, win in enumerate(top_windows[:3]):
-                print(f"    [{i}] Window start:0x{win['window_start']:06X}, First addr:0x{win['first_addr']:06X}, Score:{win['score']:.1f}")
+                print(f"    Found {len(scores)} windows, keeping top 5")
+                for i, win in enumerate(top_windows[:3]):
+                    print(f"    [{i}] Window start:0x{window_starts[win]:06X}, First addr:0x{first_addrs[win]:06X}, Score:{scores[win]:.1f}")
 
-            if base_alignment is None and top_windows:
-                best_first_addr = top_windows[0]['first_addr']
-                base_alignment = best_first_addr % LARGE_STRIDE
-                print(f"    Determined grid alignment: 0x{best_first_addr:06X} % {LARGE_STRIDE} = {base_alignment}")
+                if base_alignment is None and top_windows:
+                    best_first_addr = first_addrs[top_windows[0]]
+                    base_alignment = best_first_addr % LARGE_STRIDE
+                    print(f"    Determined grid alignment: 0x{best_first_addr:06X} % {LARGE_STRIDE} = {base_alignment}")
 
-            next_stride = max(min_stride, current_stride // 2)
-            current_regions = []
+                next_stride = max(min_stride, current_stride // 2)
+                current_regions = []
 
-            for win in top_windows:
-                first_addr = win['first_addr']
+                for win in top_windows:
+                    first_addr = first_addrs[win]
 
-                chars_extend = (current_stride // LARGE_STRIDE) + 1
+                    chars_extend = (current_stride // LARGE_STRIDE) + 1
 
-                region_start = first_addr - chars_extend * LARGE_STRIDE
-                region_end = first_addr + chars_extend * LARGE_STRIDE
+                    region_start = first_addr - chars_extend * LARGE_STRIDE
+                    region_end = first_addr + chars_extend * LARGE_STRIDE
 
-                region_start = max(search_start, region_start)
-                region_end = min(search_end, region_end)
+                    region_start = max(search_start, region_start)
+                    region_end = min(search_end, region_end)
 
-                current_regions.append({'start': region_start, 'end': region_end})
+                    current_regions.append({'start': region_start, 'end': region_end})
 
-            current_stride = next_stride
+                current_stride = next_stride
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
         print(f"\n  ✅ Best candidate: 0x{best_addr:08X}")
         print(f"  Score: {best_score}")
@@ -254,30 +361,26 @@ class FirmwareAnalyzer:
         """
         LARGE_STRIDE = 33
 
-        match_count = 0
-
-        for i in range(3):
-            addr = large_base + i * LARGE_STRIDE
-
-            if addr + LARGE_STRIDE > len(self.firmware):
-                return False
+        if large_base + 3 * LARGE_STRIDE > len(self.firmware):
+            return False
 
-            byte_32 = self.firmware[addr + 32]
+        # Footer bytes of the first 3 characters, gathered with one strided slice
+        footers = self.firmware[large_base + 32:large_base + 3 * LARGE_STRIDE:LARGE_STRIDE]
 
-            if byte_32 == preferred_footer:
-                match_count += 1
-            elif byte_32 == 0x8F:
-                pass
-            else:
-                return False
+        # Every footer must be preferred_footer or 0x8F
+        if footers.translate(None, bytes((preferred_footer, 0x8F))):
+            return False
 
-        return match_count >= 2
+        return footers.count(preferred_footer) >= 2
 
-    def _find_all_7e_sequences(self, min_length=10):
+    def _scan_7e_sequences(self, min_length=10):
         """Find all 0xXX7E sequences in firmware.
 
-        Searches for 16-bit values where low byte = 0x7E, typically
-        indicating font data structures.
+        Searches for runs of 16-bit values where low byte = 0x7E, typically
+        indicating font data structures (e.g. 0x0D7E, 0x0E7E, 0x0F7E...).
+        Callers pick a candidate from the result, e.g. the longest run whose
+        first_value lies in 0x0000-0x9000. The scan runs once per
+        min_length; later calls share its result.
 
         Args:
             min_length: Minimum sequence length to record
@@ -285,38 +388,30 @@ class FirmwareAnalyzer:
         Returns:
             List of sequence dictionaries sorted by length (descending).
         """
+        if min_length in self._7e_sequences:
+            return self._7e_sequences[min_length]
+
         search_start = 0x10000
         search_end = min(len(self.firmware), 0x1000000)
 
-        sequences = []
-        addr = search_start
-
-        while addr + 2 < search_end:
-            val = struct.unpack('<H', self.firmware[addr:addr+2])[0]
-
-            if (val & 0xFF) == 0x7E:
-                seq_start = addr
-                seq_len = 0
-                check_addr = addr
+        # Low byte of every 16-bit value in the search range
+        low_bytes = self.firmware[search_start:search_end - 2:2]
 
-                while check_addr + 2 < search_end:
-                    val = struct.unpack('<H', self.firmware[check_addr:check_addr+2])[0]
-                    if (val & 0xFF) == 0x7E:
-                        seq_len += 1
-                        check_addr += 2
-                    else:
-                        break
-
-                if seq_len >= min_length:
-                    sequences.append({
-                        'start': seq_start,
-                        'length': seq_len,
-                        'first_value': struct.unpack('<H', self.firmware[seq_start:seq_start+2])[0]
-                    })
-
-            addr += 2
+        sequences = []
+        for run in re.finditer(rb'\x7E+', low_bytes):
+            seq_start = search_start + run.start() * 2
+            seq_len = run.end() - run.start()
+
+            # Runs are maximal: sub-runs starting inside a run are not repeated
+            if seq_len >= min_length:
+                sequences.append({
+                    'start': seq_start,
+                    'length': seq_len,
+                    'first_value': _U16.unpack_from(self.firmware, seq_start)[0]
+                })
 
         sequences.sort(key=lambda x: x['length'], reverse=True)
+        self._7e_sequences[min_length] = sequences
         return sequences
 
     def _matches_v310_font_data(self, large_base):
@@ -328,88 +423,17 @@ class FirmwareAnalyzer:
         Returns:
             True if first 5 characters match reference data.
         """
-        try:
-            with open('firmwares/ECHO MINI V3.1.0/HIFIEC10.IMG', 'rb') as f:
-                fw_v310 = f.read()
-
-            v310_base = 0x4273CA
-            LARGE_STRIDE = 33
-
-            for i in range(5):
-                v310_addr = v310_base + i * LARGE_STRIDE
-                v310_data = fw_v310[v310_addr:v310_addr+LARGE_STRIDE]
-
-                test_addr = large_base + i * LARGE_STRIDE
-
-                if test_addr + LARGE_STRIDE > len(self.firmware):
-                    return False
-
-                test_data = self.firmware[test_addr:test_addr+LARGE_STRIDE]
-
-                if test_data != v310_data:
-                    return False
+        LARGE_STRIDE = 33
 
-            return True
-        except:
+        try:
+            reference = _v310_reference()
+        except OSError:
             return False
 
-    def _find_7e_sequence(self, min_length=10, max_sequences=5):
-        """Search for 0xXX7E sequence pattern.
-
-        Pattern characteristics: low byte = 0x7E, incrementing high byte
-        Examples: 0x0D7E, 0x0E7E, 0x0F7E, 0x107E...
-
-        Args:
-            min_length: Minimum sequence length to consider
-            max_sequences: Maximum number of sequences to analyze
-
-        Returns:
-            Starting address of best sequence, or None if not found.
-        """
-        search_start = 0x10000
-        search_end = min(len(self.firmware), 0x1000000)
-
-        sequences = []
-
-        addr = search_start
-        while addr + 2 < search_end:
-            val = struct.unpack('<H', self.firmware[addr:addr+2])[0]
-
-            if (val & 0xFF) == 0x7E:
-                seq_start = addr
-
-                seq_len = 0
-                check_addr = addr
-
-                while check_addr + 2 < search_end:
-                    val = struct.unpack('<H', self.firmware[check_addr:check_addr+2])[0]
-
-                    if (val & 0xFF) == 0x7E:
-                        seq_len += 1
-                        check_addr += 2
-                    else:
-                        break
-
-                if seq_len >= min_length:
-                    sequences.append({
-                        'start': seq_start,
-                        'length': seq_len,
-                        'first_value': struct.unpack('<H', self.firmware[seq_start:seq_start+2])[0]
-                    })
-
-            addr += 2
-
-        if sequences:
-            sequences.sort(key=lambda x: x['length'], reverse=True)
-
-            for seq in sequences[:5]:
-                first_value = seq['first_value']
-                if 0x0000 <= first_value <= 0x9000:
-                    best = seq
-                    print(f"    Found {len(sequences)} sequences, selected: length={best['length']}, start=0x{best['start']:06X}, first_value=0x{best['first_value']:04X}")
-                    return best['start']
+        if len(reference) != 5 * LARGE_STRIDE or large_base + len(reference) > len(self.firmware):
+            return False
 
-        return None
+        return self.firmware[large_base:large_base + len(reference)] == reference
 
     def detect_addresses(self):
         """Detect all critical font table addresses.
@@ -459,7 +483,7 @@ class FirmwareAnalyzer:
             addr = addresses['SMALL_BASE'] + char_code * SMALL_STRIDE
             if addr + SMALL_STRIDE <= len(self.firmware):
                 chunk = self.firmware[addr:addr + SMALL_STRIDE]
-                if not (all(b == 0 for b in chunk) or all(b == 0xFF for b in chunk)):
+                if chunk != _ZEROS_32 and chunk != _ONES_32:
                     confidence['small_font_valid'] += 1
 
         LARGE_STRIDE = 33
@@ -467,18 +491,255 @@ class FirmwareAnalyzer:
             addr = addresses['LARGE_BASE'] + (char_code - 0x4E00) * LARGE_STRIDE
             if addr + LARGE_STRIDE <= len(self.firmware):
                 chunk = self.firmware[addr:addr + LARGE_STRIDE]
-                if not (all(b == 0 for b in chunk) or all(b == 0xFF for b in chunk)):
+                if chunk != _ZEROS_33 and chunk != _ONES_33:
                     confidence['large_font_valid'] += 1
 
+        # Jump between F2 40 prefixes with a C-level search, checking only the 0x42 operand byte
         movw_count = 0
-        for i in range(len(self.firmware) - 6):
-            if self.firmware[i:i+2] == b'\xF2\x40' and self.firmware[i+4] == 0x42:
+        search_end = max(0, len(self.firmware) - 5)
+        i = self.firmware.find(b'\xF2\x40', 0, search_end)
+        while i != -1:
+            if self.firmware[i+4] == 0x42:
                 movw_count += 1
+            i = self.firmware.find(b'\xF2\x40', i + 1, search_end)
         confidence['movw_0042_count'] = movw_count
 
         return confidence
 
 
+# MSB-first pixel bits of every byte value
+_BYTE_BITS = [[(value >> bit) & 1 for bit in range(7, -1, -1)] for value in range(256)]
+
+# Pixel bits (0/1) to ASCII binary digits
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# Two-colour palette: white (0), black (1)
+_BMP_PALETTE = bytes([0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00])
+
+
+@functools.lru_cache(maxsize=None)
+def _mono_bmp_prefix(width, height):
+    """Headers and palette of a width x height monochrome BMP file."""
+    row_bytes = ((width + 31) // 32) * 4
+    biSizeImage = row_bytes * height
+    bfOffBits = 62
+    file_size = bfOffBits + biSizeImage
+
+    header = FontExtractor.BMP_HEADER.pack(
+        0x4D42, file_size, 0, 0, bfOffBits,
+        40, width, height, 1, 1, 0, biSizeImage, 2835, 2835, 2, 2,
+    )
+    return header + _BMP_PALETTE
+
+
+@functools.lru_cache(maxsize=None)
+def _keep_high_bits(count):
+    """Translation table clearing all but the top count bits of a byte."""
+    mask = (0xFF << (8 - min(max(count, 0), 8))) & 0xFF
+    return bytes(value & mask for value in range(256))
+
+
+@functools.lru_cache(maxsize=None)
+def _blank_chunks(stride):
+    """Blank (all 0x00 or all 0xFF) font entries of one stride.
+
+    Args:
+        stride: Font entry stride in bytes
+
+    Returns:
+        Tuple of the two blank entries, compared with memcmp via ``in``.
+    """
+    return (b'\x00' * stride, b'\xFF' * stride)
+
+
+def _v8_byte_order(config):
+    """Resolve the V8 sw_mcu swaps of a 3-bit config to a row byte order.
+
+    The swaps only reorder the two bytes of each row, so they can be
+    applied once to the byte positions.
+
+    Args:
+        config: Lookup bits 3-5 (bit 0 = sw_mcu_bits, bit 1 = sw_mcu_hw_swap,
+            bit 2 = sw_mcu_byte_swap)
+
+    Returns:
+        Tuple of (high, low) byte offsets within a row.
+    """
+    sw_mcu_bits = config & 1
+    sw_mcu_hw_swap = (config >> 1) & 1
+    sw_mcu_byte_swap = (config >> 2) & 1
+
+    if sw_mcu_bits == 1:
+        high, low = 1, 0
+        if sw_mcu_byte_swap:
+            high, low = low, high
+    else:
+        high, low = (1, 0) if sw_mcu_hw_swap == sw_mcu_byte_swap else (0, 1)
+        if sw_mcu_byte_swap:
+            high, low = low, high
+        if sw_mcu_hw_swap:
+            high, low = low, high
+
+    if not ((sw_mcu_bits == 1) and (sw_mcu_byte_swap == 1)):
+        high, low = low, high
+
+    return high, low
+
+
+# Row byte order of every V8 glyph. All 8 sw_mcu configs give the same
+# order because the swaps cancel: with sw_mcu_bits set, exactly one of the
+# byte swap and the trailing swap applies; with it clear, the starting order
+# already undoes the hw/byte swaps that follow, and the trailing swap always
+# applies. So the lookup value never changes how a row's bytes are read.
+_V8_ROW_ORDER = _v8_byte_order(0)
+assert all(_v8_byte_order(config) == _V8_ROW_ORDER for config in range(8))
+
+
+def range_bucket(range_name):
+    """Map a Unicode range name to one of 256 output bucket directories.
+
+    Args:
+        range_name: Unicode range name (e.g. "CJK_Unified")
+
+    Returns:
+        Two-digit hex bucket name.
+    """
+    return hashlib.blake2b(range_name.encode(), digest_size=1).hexdigest()
+
+
+# Per-process analyzer used by search worker processes
+_search_analyzer = None
+
+
+def _init_search_worker(firmware_path):
+    """Map the firmware once in a search worker process."""
+    global _search_analyzer
+    _search_analyzer = FirmwareAnalyzer(firmware_path)
+
+
+def _score_window_task(window_start, window_end, FOOTER_SIGNATURES, LARGE_STRIDE, base_alignment):
+    """Score one search window in a worker process (see FirmwareAnalyzer._score_window)."""
+    return _search_analyzer._score_window(window_start, window_end, FOOTER_SIGNATURES, LARGE_STRIDE,
+                                          base_alignment)
+
+
+_range_extractor = None
+
+
+def _init_range_worker(firmware_path, addresses, bucket_hash, write_threads):
+    """Map the firmware once in a range extraction worker process."""
+    global _range_extractor
+    _range_extractor = FontExtractor(FirmwareAnalyzer(firmware_path).firmware, addresses,
+                                     bucket_hash=bucket_hash, write_threads=write_threads)
+
+
+def _extract_range_task(name, start, end, output_dir):
+    """Extract one Unicode range in a worker process (see FontExtractor.extract_range).
+
+    Returns:
+        Tuple of (SMALL fonts, LARGE fonts, captured stdout).
+    """
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        s_count, l_count = _range_extractor.extract_range(name, start, end, output_dir)
+    return s_count, l_count, output.getvalue()
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_file(path, data):
+    """Write data to path, replacing any existing file.
+
+    Goes through os.open/os.write directly: glyph BMPs are ~100 bytes, so
+    the buffered file object costs more than the write itself.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _try_write_file(path, data):
+    """Write data to path (see _write_file).
+
+    Returns:
+        None on success, or path if the write failed.
+    """
+    try:
+        _write_file(path, data)
+    except Exception:
+        return path
+    return None
+
+
+class BatchBmpWriter:
+    """Writes queued BMP files in batches from a thread pool.
+
+    Glyph extraction produces tens of thousands of ~100-byte files, so it is
+    bound by open/write/close latency rather than bandwidth. The GIL is
+    released around those syscalls, so a pool of threads keeps several in
+    flight at once.
+
+    Queued files are only written when a batch is flushed, so a write error
+    never surfaces from add(); failed paths are collected and returned by
+    flush() instead, letting callers drop those files as the inline path does.
+    """
+
+    def __init__(self, workers, batch_size=1024):
+        """Initialize batch writer.
+
+        Args:
+            workers: Number of writer threads
+            batch_size: Number of queued files that triggers a flush
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.pending = []
+        self.failed = []
+        self._executor = None
+
+    def add(self, path, data):
+        """Queue a file for writing.
+
+        Args:
+            path: Output file path
+            data: File contents
+        """
+        self.pending.append((path, data))
+        if len(self.pending) >= self.batch_size:
+            self._write_pending()
+
+    def _write_pending(self):
+        """Write every queued file, recording the paths that failed."""
+        if not self.pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        paths, blobs = zip(*self.pending)
+        self.pending = []
+        self.failed.extend(path for path in self._executor.map(_try_write_file, paths, blobs)
+                           if path is not None)
+
+    def flush(self):
+        """Write every queued file.
+
+        Returns:
+            List of paths whose write failed since the previous flush.
+        """
+        self._write_pending()
+        failed, self.failed = self.failed, []
+        return failed
+
+    def close(self):
+        """Flush queued files and stop the writer threads."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
 class FontExtractor:
     """Extracts font glyphs from firmware data and exports to BMP format.
 
@@ -647,13 +908,20 @@ class FontExtractor:
         ("Specials", 0xFFF0, 0xFFFF),
     ]
 
-    def __init__(self, firmware, addresses, unicode_ranges=None):
+    # BITMAPFILEHEADER + BITMAPINFOHEADER
+    BMP_HEADER = struct.Struct('<HIHHIIiiHHIIiiII')
+
+    def __init__(self, firmware, addresses, unicode_ranges=None, bucket_hash=False, write_threads=0):
         """Initialize font extractor.
 
         Args:
-            firmware: Raw firmware data as bytes
+            firmware: Raw firmware data (bytes or a read-only mmap)
             addresses: Dictionary with SMALL_BASE, LARGE_BASE, LOOKUP_TABLE
             unicode_ranges: Optional custom list of (name, start, end) tuples
+            bucket_hash: If True, nest range directories under a hash bucket
+                (<output>/<type>/<bucket>/<range>) to keep directories small
+            write_threads: If non-zero, write BMP files in batches from this
+                many threads (see BatchBmpWriter)
         """
         self.firmware = firmware
         self.SMALL_BASE = addresses['SMALL_BASE']
@@ -661,9 +929,13 @@ class FontExtractor:
         self.LOOKUP_TABLE = addresses['LOOKUP_TABLE']
         self.SMALL_STRIDE = 32
         self.LARGE_STRIDE = 33
+        self.bucket_hash = bucket_hash
+        self.bmp_writer = BatchBmpWriter(write_threads) if write_threads else None
 
         if unicode_ranges:
             self.UNICODE_RANGES = unicode_ranges
+        self._bmp_buffers = {}
+        self._valid_fills = {}
 
     def unicode_to_small_addr(self, unicode_val):
         """Convert Unicode code point to SMALL font table address.
@@ -698,6 +970,22 @@ class FontExtractor:
         """
         return self.firmware[self.LOOKUP_TABLE + (unicode_val >> 3)]
 
+    def get_lookup_range(self, start, end):
+        """Get the lookup table bytes covering a Unicode range.
+
+        One lookup byte serves 8 consecutive code points, so the value for
+        code point u is at index (u >> 3) - (start >> 3). The slice is
+        truncated where the table runs past the end of the firmware.
+
+        Args:
+            start: Start of Unicode range
+            end: End of Unicode range (inclusive)
+
+        Returns:
+            Lookup configuration bytes
+        """
+        return self.firmware[self.LOOKUP_TABLE + (start >> 3):self.LOOKUP_TABLE + (end >> 3) + 1]
+
     def decode_v8(self, chunk, lookup_val):
         """Decode V8 format font data into pixel rows.
 
@@ -708,105 +996,121 @@ class FontExtractor:
         Returns:
             List of pixel rows (16 rows x 15 bits each)
         """
-        config_byte = lookup_val & 0xFF
-        sw_mcu_bits = (config_byte >> 3) & 1
-        sw_mcu_hw_swap = (config_byte >> 4) & 1
-        sw_mcu_byte_swap = (config_byte >> 5) & 1
-
-        pixels = []
-        for i in range(0, len(chunk), 2):
-            if i + 1 >= len(chunk):
-                break
-
-            b0, b1 = chunk[i], chunk[i+1]
-
-            if sw_mcu_bits == 1:
-                val = (b1 << 8) | b0
-                if sw_mcu_byte_swap:
-                    val = ((val & 0xFF) << 8) | ((val >> 8) & 0xFF)
-                final_pixel = val
-            else:
-                cycle_1, cycle_2 = (b1, b0) if sw_mcu_hw_swap == sw_mcu_byte_swap else (b0, b1)
-                if sw_mcu_byte_swap:
-                    cycle_1, cycle_2 = cycle_2, cycle_1
-                if sw_mcu_hw_swap:
-                    cycle_1, cycle_2 = cycle_2, cycle_1
-                final_pixel = cycle_2 | (cycle_1 << 8)
+        high, low = _V8_ROW_ORDER
+
+        return [_BYTE_BITS[h] + _BYTE_BITS[l] for h, l in zip(chunk[high::2], chunk[low::2])]
+
+    def encode_bmp(self, pixels, width=16, height=16):
+        """Encode pixels as a monochrome BMP file.
+
+        Args:
+            pixels: 2D list of bits (0 or 1)
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            Complete BMP file contents as bytes.
+        """
+        row_bytes = ((width + 31) // 32) * 4
+
+        # Pack each row (bottom-up) by parsing its bits as one binary number
+        rows = []
+        for y in range(height - 1, -1, -1):
+            bits = bytes(pixels[y][:width]) if y < len(pixels) else b''
+            value = int(b'0' + bits.translate(_BIT_DIGITS), 2)
+            rows.append((value << (row_bytes * 8 - len(bits))).to_bytes(row_bytes, 'big'))
+
+        return _mono_bmp_prefix(width, height) + b''.join(rows)
+
+    def encode_v8_bmp(self, chunk, lookup_val, width=16, height=16):
+        """Encode a V8 glyph as a monochrome BMP straight from its raw bytes.
+
+        Same output as encode_bmp on the decode_v8 pixels cropped to
+        width x height (at most 16x16). A decoded row is just the row's two
+        bytes in the configured order, so the bitmap rows are sliced out of
+        the chunk in a few C-level passes instead of via per-pixel lists.
+
+        Args:
+            chunk: Raw font data bytes (16 rows of 2 bytes)
+            lookup_val: Configuration value from lookup table
+            width: Image width in pixels (at most 16)
+            height: Image height in pixels (at most 16)
+
+        Returns:
+            Complete BMP file contents as bytes.
+        """
+        return bytes(self._fill_v8_bmp(chunk, lookup_val, width, height))
+
+    def _fill_v8_bmp(self, chunk, lookup_val, width, height):
+        """Encode a V8 glyph into the reusable BMP buffer for its size.
+
+        Glyph BMPs of one size differ only in their pixel bytes, so one
+        buffer per size is kept and just those bytes are overwritten.
+
+        Returns:
+            The shared buffer, valid until the next glyph of this size.
+        """
+        buf = self._bmp_buffers.get((width, height))
+        if buf is None:
+            buf = bytearray(_mono_bmp_prefix(width, height)) + bytearray(4 * height)
+            self._bmp_buffers[(width, height)] = buf
+
+        high, low = _V8_ROW_ORDER
+        last = 2 * (height - 1)
+        rows = len(buf) - 4 * height
 
-            if not ((sw_mcu_bits == 1) and (sw_mcu_byte_swap == 1)):
-                final_pixel = ((final_pixel & 0xFF) << 8) | ((final_pixel >> 8) & 0xFF)
+        # Rows bottom-up, each padded to 4 bytes: [high byte, low byte, 0, 0]
+        buf[rows::4] = chunk[last + high::-2][:height].translate(_keep_high_bits(width))
+        buf[rows + 1::4] = chunk[last + low::-2][:height].translate(_keep_high_bits(width - 8))
 
-            row_bits = [(final_pixel >> bit) & 1 for bit in range(15, -1, -1)]
-            pixels.append(row_bits)
+        return buf
 
-        return pixels
+    def write_v8_bmp(self, path, chunk, lookup_val, width=16, height=16):
+        """Write a V8 glyph as a monochrome BMP file (see encode_v8_bmp).
+
+        Written immediately from the reusable buffer, or queued as a copy
+        when a batch writer is configured.
+
+        Args:
+            path: Output file path
+            chunk: Raw font data bytes (16 rows of 2 bytes)
+            lookup_val: Configuration value from lookup table
+            width: Image width in pixels (at most 16)
+            height: Image height in pixels (at most 16)
+        """
+        if self.bmp_writer is not None:
+            self.bmp_writer.add(path, self.encode_v8_bmp(chunk, lookup_val, width, height))
+        else:
+            _write_file(path, self._fill_v8_bmp(chunk, lookup_val, width, height))
 
     def write_bmp(self, path, pixels, width=16, height=16):
         """Write monochrome BMP file.
 
+        Queued on the batch writer when one is configured, otherwise
+        written immediately.
+
         Args:
             path: Output file path
             pixels: 2D list of bits (0 or 1)
             width: Image width in pixels
             height: Image height in pixels
         """
-        import struct as struct_pkg
-        bfType = 0x4D42
-        bfOffBits = 62
-        biSize = 40
-        biWidth = width
-        biHeight = height
-        biBitCount = 1
-        biSizeImage = ((width + 31) // 32) * 4 * height
-
-        file_size = bfOffBits + biSizeImage
-
-        with open(path, 'wb') as f:
-            f.write(struct_pkg.pack('<H', bfType))
-            f.write(struct_pkg.pack('<I', file_size))
-            f.write(struct_pkg.pack('<H', 0))
-            f.write(struct_pkg.pack('<H', 0))
-            f.write(struct_pkg.pack('<I', bfOffBits))
-            f.write(struct_pkg.pack('<I', biSize))
-            f.write(struct_pkg.pack('<i', biWidth))
-            f.write(struct_pkg.pack('<i', biHeight))
-            f.write(struct_pkg.pack('<H', 1))
-            f.write(struct_pkg.pack('<H', biBitCount))
-            f.write(struct_pkg.pack('<I', 0))
-            f.write(struct_pkg.pack('<I', biSizeImage))
-            f.write(struct_pkg.pack('<i', 2835))
-            f.write(struct_pkg.pack('<i', 2835))
-            f.write(struct_pkg.pack('<I', 2))
-            f.write(struct_pkg.pack('<I', 2))
-
-            for color in [0xFFFFFF, 0x000000]:
-                f.write(struct_pkg.pack('BBBB', color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF, 0))
-
-            row_bytes = ((width + 31) // 32) * 4
-
-            for y in range(height - 1, -1, -1):
-                row_data = []
-                current_byte = 0
-                bit_count = 0
-
-                for x in range(width):
-                    bit = pixels[y][x] if y < len(pixels) and x < len(pixels[y]) else 0
-                    current_byte = (current_byte << 1) | bit
-                    bit_count += 1
-
-                    if bit_count == 8:
-                        row_data.append(current_byte)
-                        current_byte = 0
-                        bit_count = 0
-
-                if bit_count > 0:
-                    current_byte <<= (8 - bit_count)
-                    row_data.append(current_byte)
-
-                while len(row_data) < row_bytes:
-                    row_data.append(0)
-
-                f.write(bytes(row_data))
+        self.write_file(path, self.encode_bmp(pixels, width, height))
+
+    def write_file(self, path, data):
+        """Write an encoded file.
+
+        Queued on the batch writer when one is configured, otherwise
+        written immediately.
+
+        Args:
+            path: Output file path
+            data: File contents
+        """
+        if self.bmp_writer is not None:
+            self.bmp_writer.add(path, data)
+        else:
+            _write_file(path, data)
 
     def is_valid_font_data(self, pixels, font_type):
         """Validate font data by checking pixel fill ratio.
@@ -829,6 +1133,30 @@ class FontExtractor:
         else:
             return 0.01 < ratio < 0.95
 
+    def is_valid_font_data_batch(self, chunks, font_type):
+        """Validate many raw V8 font entries at once.
+
+        Equivalent to is_valid_font_data on each entry's decode_v8 pixels.
+        Those are always the 16x16 bits of the entry's first 32 bytes, so
+        the fill ratio is simply their popcount out of 256.
+
+        Args:
+            chunks: Sequence of raw font data bytes
+            font_type: Either "SMALL" or "LARGE"
+
+        Returns:
+            List of booleans, one per chunk.
+        """
+        valid_fills = self._valid_fills.get(font_type)
+        if valid_fills is None:
+            # Evaluate the scalar check once per possible popcount
+            valid_fills = [self.is_valid_font_data([[1] * filled + [0] * (256 - filled)], font_type)
+                           for filled in range(257)]
+            self._valid_fills[font_type] = valid_fills
+
+        return [len(chunk) >= 32 and valid_fills[int.from_bytes(chunk[:32], 'big').bit_count()]
+                for chunk in chunks]
+
     def extract_font_range(self, start, end, font_type, addr_func, stride, output_dir, range_name=""):
         """Extract fonts for a Unicode range.
 
@@ -836,7 +1164,8 @@ class FontExtractor:
             start: Start of Unicode range
             end: End of Unicode range
             font_type: Either "SMALL" or "LARGE"
-            addr_func: Function to convert Unicode to address
+            addr_func: Function to convert Unicode to address (entries must be
+                stride bytes apart, as in both font tables)
             stride: Font entry stride in bytes
             output_dir: Base output directory
             range_name: Optional descriptive name for range
@@ -845,56 +1174,130 @@ class FontExtractor:
             Number of fonts successfully extracted.
         """
         range_prefix = f"U+{start:04X}-{end:04X}_{range_name}" if range_name else f"U+{start:04X}-{end:04X}"
-        out_dir = os.path.join(output_dir, font_type, range_prefix)
+        if self.bucket_hash:
+            out_dir = os.path.join(output_dir, font_type, range_bucket(range_name or range_prefix), range_prefix)
+        else:
+            out_dir = os.path.join(output_dir, font_type, range_prefix)
         os.makedirs(out_dir, exist_ok=True)
 
-        count = 0
-        for uni in range(start, end + 1):
-            addr = addr_func(uni)
-
-            if addr < 0 or addr + stride > len(self.firmware):
-                continue
-
+        blank_chunks = _blank_chunks(stride)
+
+        # Gather every stored, non-blank entry first (one list per field),
+        # then validate them all in one batch
+        unis = []
+        addrs = []
+        chunks = []
+        lookup_vals = []
+
+        # Entries are stride apart, so the range's addresses are one
+        # arithmetic progression: clip it to the firmware once instead of
+        # converting and bounds-checking every code point
+        first_addr = addr_func(start)
+        first = max(0, -(first_addr // stride))
+        lookups = self.get_lookup_range(start, end)
+        lookup_base = start >> 3
+        stop = min(end - start + 1, (len(self.firmware) - stride - first_addr) // stride + 1)
+
+        # Unused ranges are often one solid fill; when the whole block is
+        # 0x00 or 0xFF every entry in it is blank, so skip the walk entirely
+        block = self.firmware[first_addr + first * stride:first_addr + stop * stride]
+        if not block.strip(b'\x00') or not block.strip(b'\xFF'):
+            stop = first
+
+        for uni, addr in zip(range(start + first, start + stop),
+                             range(first_addr + first * stride, first_addr + stop * stride, stride)):
             chunk = self.firmware[addr:addr + stride]
 
-            if all(b == 0 for b in chunk) or all(b == 0xFF for b in chunk):
+            if chunk in blank_chunks:
                 continue
 
-            try:
-                lookup_val = self.get_lookup(uni)
-                pixels = self.decode_v8(chunk, lookup_val)
+            lookup_index = (uni >> 3) - lookup_base
+            if lookup_index >= len(lookups):
+                continue
+            lookup_val = lookups[lookup_index]
 
-                if not pixels or len(pixels) != 16:
-                    continue
+            unis.append(uni)
+            addrs.append(addr)
+            chunks.append(chunk)
+            lookup_vals.append(lookup_val)
 
-                if not self.is_valid_font_data(pixels, font_type):
-                    continue
+        # Drop glyphs failing validation up front, so only writes remain
+        valid = self.is_valid_font_data_batch(chunks, font_type)
 
+        extracted = []
+        paths = []
+        for uni, addr, chunk, lookup_val in compress(zip(unis, addrs, chunks, lookup_vals), valid):
+            try:
                 header = lookup_val & 0xFF
-                name = f"0x{addr:06X}_H{header:02X}_U+{uni:04X}.bmp"
+                path = os.path.join(out_dir, f"0x{addr:06X}_H{header:02X}_U+{uni:04X}.bmp")
 
                 # For SMALL fonts, only extract the top-left 10x10 pixels
                 if font_type == "SMALL":
-                    pixels = [row[:10] for row in pixels[:10]]
-                    self.write_bmp(os.path.join(out_dir, name), pixels, width=10, height=10)
+                    self.write_v8_bmp(path, chunk, lookup_val, width=10, height=10)
                 else:
-                    self.write_bmp(os.path.join(out_dir, name), pixels)
-                count += 1
+                    self.write_v8_bmp(path, chunk, lookup_val)
+                extracted.append(uni)
+                paths.append(path)
 
             except Exception:
                 continue
 
-            if count % 100 == 0:
-                print(f"  {font_type}: {count} extracted (U+{uni:04X})...")
+        # Queued writes only fail once flushed; drop those glyphs so batched
+        # mode counts the same files as writing inline
+        if self.bmp_writer is not None:
+            failed = set(self.bmp_writer.flush())
+            if failed:
+                extracted = [uni for uni, path in zip(extracted, paths) if path not in failed]
+
+        # Report every 100th glyph written, in one write after the loop
+        count = len(extracted)
+        sys.stdout.write(''.join(f"  {font_type}: {n} extracted (U+{uni:04X})...\n"
+                                 for n, uni in zip(range(100, count + 1, 100), extracted[99::100])))
 
         print(f"  {font_type} {range_prefix}: {count} extracted")
         return count
 
-    def extract_all(self, output_dir):
+    def extract_range(self, name, start, end, output_dir):
+        """Extract SMALL and LARGE glyphs for one Unicode range.
+
+        Args:
+            name: Range name
+            start: Starting Unicode code point
+            end: Ending Unicode code point
+            output_dir: Base output directory
+
+        Returns:
+            Tuple of (SMALL fonts, LARGE fonts) extracted.
+        """
+        print(f"\nProcessing: {name} (U+{start:04X} - U+{end:04X})")
+
+        s_count = self.extract_font_range(
+            start, end, "SMALL",
+            self.unicode_to_small_addr,
+            self.SMALL_STRIDE,
+            output_dir, name
+        )
+
+        l_count = self.extract_font_range(
+            start, end, "LARGE",
+            self.unicode_to_large_addr,
+            self.LARGE_STRIDE,
+            output_dir, name
+        )
+
+        return s_count, l_count
+
+    def extract_all(self, output_dir, firmware_path=None, range_workers=1):
         """Extract all fonts for configured Unicode ranges.
 
         Args:
             output_dir: Base output directory
+            firmware_path: Path the firmware was mapped from; required for
+                range_workers > 1 so each worker can map it itself
+            range_workers: Number of processes extracting ranges in parallel
+
+        Returns:
+            Tuple of (total SMALL fonts, total LARGE fonts) extracted.
         """
         print("\nScanning Unicode ranges...")
         print("=" * 80)
@@ -902,24 +1305,29 @@ class FontExtractor:
         total_small = 0
         total_large = 0
 
-        for name, start, end in self.UNICODE_RANGES:
-            print(f"\nProcessing: {name} (U+{start:04X} - U+{end:04X})")
-
-            s_count = self.extract_font_range(
-                start, end, "SMALL",
-                self.unicode_to_small_addr,
-                self.SMALL_STRIDE,
-                output_dir, name
-            )
-            total_small += s_count
-
-            l_count = self.extract_font_range(
-                start, end, "LARGE",
-                self.unicode_to_large_addr,
-                self.LARGE_STRIDE,
-                output_dir, name
-            )
-            total_large += l_count
+        try:
+            if range_workers > 1 and firmware_path and self.UNICODE_RANGES:
+                addresses = {'SMALL_BASE': self.SMALL_BASE, 'LARGE_BASE': self.LARGE_BASE,
+                             'LOOKUP_TABLE': self.LOOKUP_TABLE}
+                write_threads = self.bmp_writer.workers if self.bmp_writer is not None else 0
+                with ProcessPoolExecutor(max_workers=range_workers, initializer=_init_range_worker,
+                                         initargs=(firmware_path, addresses, self.bucket_hash,
+                                                   write_threads)) as pool:
+                    names, starts, ends = zip(*self.UNICODE_RANGES)
+                    # Workers buffer their output; print it back in range order
+                    for s_count, l_count, output in pool.map(_extract_range_task, names, starts, ends,
+                                                             repeat(output_dir)):
+                        sys.stdout.write(output)
+                        total_small += s_count
+                        total_large += l_count
+            else:
+                for name, start, end in self.UNICODE_RANGES:
+                    s_count, l_count = self.extract_range(name, start, end, output_dir)
+                    total_small += s_count
+                    total_large += l_count
+        finally:
+            if self.bmp_writer is not None:
+                self.bmp_writer.close()
 
         print("\n" + "=" * 80)
         print("DONE!")
@@ -928,6 +1336,159 @@ class FontExtractor:
         print(f"  Output: {output_dir}")
         print("=" * 80)
 
+        return total_small, total_large
+
+
+def load_ranges_file(path):
+    """Load Unicode ranges from a tab-separated file.
+
+    Each non-empty line holds "name<TAB>start<TAB>end" with hexadecimal
+    bounds. Lines starting with '#' are ignored.
+
+    Args:
+        path: Path to ranges file
+
+    Returns:
+        List of (name, start, end) tuples.
+    """
+    unicode_ranges = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                name, start, end = line.split('\t')
+                unicode_ranges.append((name, int(start, 16), int(end, 16)))
+            except ValueError as e:
+                print(f"Warning: Failed to parse range {line!r}: {e}", file=sys.stderr)
+    return unicode_ranges
+
+
+def write_done_marker(output_dir, done_tag, small_count, large_count):
+    """Record a completed extraction in its output directory.
+
+    Writes counts.txt with the extracted totals, then an empty
+    ".done_<done_tag>" sentinel. The sentinel is written last, so it only
+    exists once the output is complete.
+
+    Args:
+        output_dir: Base output directory for the firmware
+        done_tag: Caller-chosen tag identifying the firmware contents
+        small_count: Number of SMALL fonts extracted
+        large_count: Number of LARGE fonts extracted
+    """
+    with open(os.path.join(output_dir, 'counts.txt'), 'w') as f:
+        f.write(f"SMALL={small_count}\nLARGE={large_count}\n")
+    open(os.path.join(output_dir, f'.done_{done_tag}'), 'w').close()
+
+
+def extract_firmware(firmware_path, output_dir, unicode_ranges=None, verify_only=False, bucket_hash=False,
+                     done_tag=None, write_threads=0, search_workers=1, range_workers=1):
+    """Detect font table addresses in one firmware and extract its glyphs.
+
+    Args:
+        firmware_path: Path to firmware .IMG file
+        output_dir: Base output directory for this firmware
+        unicode_ranges: Optional custom list of (name, start, end) tuples
+        verify_only: If True, stop after address detection and validation
+        bucket_hash: If True, use the hash-bucketed output layout
+        done_tag: If given, write a completion marker on success (see write_done_marker)
+        write_threads: If non-zero, write BMP files in batches from this many threads
+        search_workers: Number of processes scoring LARGE_BASE search windows
+        range_workers: Number of processes extracting Unicode ranges
+
+    Returns:
+        Process exit status (0 on success).
+    """
+    if not os.path.isfile(firmware_path):
+        print(f"Error: Firmware file not found: {firmware_path}")
+        return 1
+
+    print("=" * 80)
+    print("Universal Font Extractor - Heuristic Offset Table Search")
+    print("=" * 80)
+    print(f"\nFirmware: {firmware_path}")
+
+    analyzer = FirmwareAnalyzer(firmware_path, search_workers)
+    addresses = analyzer.detect_addresses()
+
+    if addresses is None:
+        return 1
+
+    print("\n=== Heuristic Detection Results ===")
+    print(f"SMALL_BASE:     0x{addresses['SMALL_BASE']:06X}")
+    print(f"LARGE_BASE:     0x{addresses['LARGE_BASE']:06X}")
+    print(f"LOOKUP_TABLE:   0x{addresses['LOOKUP_TABLE']:06X}")
+    print()
+    print("=== Validation ===")
+    print(f"SMALL font samples: {addresses['confidence']['small_font_valid']}/3 valid")
+    print(f"LARGE font samples: {addresses['confidence']['large_font_valid']}/3 valid")
+    print(f"MOVW #0x0042 count: {addresses['confidence']['movw_0042_count']} (expected ~12)")
+
+    if addresses['confidence']['small_font_valid'] < 2 or addresses['confidence']['large_font_valid'] < 2:
+        print("\n⚠️  Warning: Low confidence in detected addresses!")
+        return 1
+
+    if verify_only:
+        print("\n✅ Verification complete.")
+        return 0
+
+    extractor = FontExtractor(analyzer.firmware, addresses, unicode_ranges, bucket_hash, write_threads)
+    small_count, large_count = extractor.extract_all(output_dir, firmware_path, range_workers)
+
+    if done_tag:
+        write_done_marker(output_dir, done_tag, small_count, large_count)
+
+    return 0
+
+
+def run_batch(batch_path, output_base, unicode_ranges=None, verify_only=False, bucket_hash=False,
+              write_threads=0, search_workers=1, range_workers=1):
+    """Extract fonts from every firmware listed in a batch file.
+
+    Processing several firmwares in one interpreter avoids paying Python
+    startup per firmware. Each line of the batch file holds
+    "version<TAB>firmware_path", optionally followed by "<TAB>done_tag";
+    output for a firmware goes to <output_base>/<version>. Every firmware's output is framed by
+    "##FW## <index> <version>" and "##RC## <status>" sentinel lines, index
+    being the firmware's line number in the batch file (from 0), so a parent
+    process can attribute results even when two lines share a version.
+
+    Args:
+        batch_path: Path to batch file
+        output_base: Base output directory
+        unicode_ranges: Optional custom list of (name, start, end) tuples
+        verify_only: If True, stop after address detection and validation
+        bucket_hash: If True, use the hash-bucketed output layout
+        write_threads: If non-zero, write BMP files in batches from this many threads
+        search_workers: Number of processes scoring LARGE_BASE search windows
+        range_workers: Number of processes extracting Unicode ranges
+
+    Returns:
+        Process exit status (0 if every firmware succeeded).
+    """
+    with open(batch_path) as f:
+        jobs = [line.rstrip('\n').split('\t') for line in f if line.strip()]
+
+    status = 0
+    for index, (version, firmware_path, *rest) in enumerate(jobs):
+        done_tag = rest[0] if rest else None
+        print(f"##FW## {index} {version}", flush=True)
+        try:
+            rc = extract_firmware(firmware_path, os.path.join(output_base, version),
+                                  unicode_ranges, verify_only, bucket_hash, done_tag, write_threads,
+                                  search_workers, range_workers)
+        except Exception:
+            # Keep the traceback after this firmware's output when both streams share a file
+            sys.stdout.flush()
+            traceback.print_exc()
+            rc = 1
+        print(f"##RC## {rc}", flush=True)
+        status = status or rc
+
+    return status
+
 
 def main():
     """Main entry point for font extraction.
@@ -939,14 +1500,31 @@ def main():
         description='Universal Font Extractor - Heuristic Offset Table Search',
         epilog='Example: python extract_font_universal.py firmware.img --range "CJK:0x4E00:0x9FFF"'
     )
-    parser.add_argument('firmware', help='Path to firmware .IMG file')
+    parser.add_argument('firmware', nargs='?', help='Path to firmware .IMG file')
     parser.add_argument('-o', '--output', default='extracted_font_universal')
     parser.add_argument('--verify-only', action='store_true')
     parser.add_argument('--range', action='append', dest='ranges',
                        help='Unicode range in format "name:start:end" (can be used multiple times)')
+    parser.add_argument('--ranges-file',
+                       help='File with one "name<TAB>start<TAB>end" Unicode range per line')
+    parser.add_argument('--batch',
+                       help='File with one "version<TAB>firmware_path" per line; output goes to OUTPUT/<version>')
+    parser.add_argument('--done-tag',
+                       help='On success, write counts.txt and a .done_<tag> sentinel to the output directory')
+    parser.add_argument('--bucket-hash', action='store_true',
+                       help='Nest range directories under a 256-way hash bucket: OUTPUT/<type>/<bucket>/<range>')
+    parser.add_argument('--write-threads', type=int, default=0,
+                       help='Write BMP files in batches from this many threads (default: write inline)')
+    parser.add_argument('--search-workers', type=int, default=1,
+                       help='Score LARGE_BASE search windows in this many processes (default: 1)')
+    parser.add_argument('--range-workers', type=int, default=1,
+                       help='Extract Unicode ranges in this many processes (default: 1)')
 
     args = parser.parse_args()
 
+    if (args.firmware is None) == (args.batch is None):
+        parser.error('specify exactly one of a firmware path or --batch')
+
     unicode_ranges = None
     if args.ranges:
         unicode_ranges = []
@@ -960,42 +1538,15 @@ def main():
                     print(f"Warning: Invalid range format {r}", file=sys.stderr)
             except ValueError as e:
                 print(f"Warning: Failed to parse range {r}: {e}", file=sys.stderr)
-    if not os.path.isfile(args.firmware):
-        print(f"Error: Firmware file not found: {args.firmware}")
-        sys.exit(1)
+    if args.ranges_file:
+        unicode_ranges = (unicode_ranges or []) + load_ranges_file(args.ranges_file)
 
-    import sys
-    print("=" * 80)
-    print("Universal Font Extractor - Heuristic Offset Table Search")
-    print("=" * 80)
-    print(f"\nFirmware: {args.firmware}")
-
-    analyzer = FirmwareAnalyzer(args.firmware)
-    addresses = analyzer.detect_addresses()
-
-    if addresses is None:
-        sys.exit(1)
-
-    print("\n=== Heuristic Detection Results ===")
-    print(f"SMALL_BASE:     0x{addresses['SMALL_BASE']:06X}")
-    print(f"LARGE_BASE:     0x{addresses['LARGE_BASE']:06X}")
-    print(f"LOOKUP_TABLE:   0x{addresses['LOOKUP_TABLE']:06X}")
-    print()
-    print("=== Validation ===")
-    print(f"SMALL font samples: {addresses['confidence']['small_font_valid']}/3 valid")
-    print(f"LARGE font samples: {addresses['confidence']['large_font_valid']}/3 valid")
-    print(f"MOVW #0x0042 count: {addresses['confidence']['movw_0042_count']} (expected ~12)")
-
-    if addresses['confidence']['small_font_valid'] < 2 or addresses['confidence']['large_font_valid'] < 2:
-        print("\n⚠️  Warning: Low confidence in detected addresses!")
-        sys.exit(1)
-
-    if args.verify_only:
-        print("\n✅ Verification complete.")
-        sys.exit(0)
+    if args.batch:
+        sys.exit(run_batch(args.batch, args.output, unicode_ranges, args.verify_only, args.bucket_hash,
+                           args.write_threads, args.search_workers, args.range_workers))
 
-    extractor = FontExtractor(analyzer.firmware, addresses, unicode_ranges)
-    extractor.extract_all(args.output)
+    sys.exit(extract_firmware(args.firmware, args.output, unicode_ranges, args.verify_only, args.bucket_hash,
+                              args.done_tag, args.write_threads, args.search_workers, args.range_workers))
 
 
 if __name__ == '__main__':
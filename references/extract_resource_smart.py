@@ -32,9 +32,36 @@ Detection Algorithm:
 
 import struct
 import sys
+import array
+import contextlib
+import io
+import mmap
+import os
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 
+# BITMAPFILEHEADER + BITMAPINFOHEADER + RGB565 channel masks
+_BMP_HEADER = struct.Struct('<2sI4xIIiiHHIIiiIIIII')
+
+# 108-byte Part 5 metadata entry: offset, width, height, NUL-padded name
+_METADATA_ENTRY = struct.Struct('<20xIII64s12x')
+
+# Parsed metadata table, stored column-wise: one array per field, so code
+# that only scans offsets does not touch a dict per entry
+MetadataTable = namedtuple('MetadataTable', 'offsets widths heights names count')
+
+# ASCII characters sanitize_filename replaces with '_' (path separators included)
+_UNSAFE_ASCII = {c: '_' for c in range(128) if not (chr(c).isalnum() or chr(c) in "._-(), ")}
+
+# Name bytes accepted by the metadata table backward scan: non-ASCII bytes
+# (ignored when decoding) and everything printable
+_NAME_OK_BYTES = bytes(b for b in range(256) if b >= 0x80 or chr(b).isprintable() or chr(b) in '._-(), ')
+
 
 # ============================================================================
 # Image Conversion Functions
@@ -50,11 +77,11 @@ def swap_bytes_16bit(data):
         Bytes with odd/even positions swapped. If input has odd length,
         the last byte is discarded.
     """
-    arr = bytearray(data)
-    if len(arr) % 2 != 0:
-        arr = arr[:-1]
-    arr[0::2], arr[1::2] = arr[1::2], arr[0::2]
-    return bytes(arr)
+    # array.byteswap() swaps every 16-bit word in one C pass
+    words = array.array('H')
+    words.frombytes(data[:len(data) & ~1])
+    words.byteswap()
+    return words.tobytes()
 
 
 def get_stride_info(width):
@@ -92,17 +119,16 @@ def restride_to_bmp(raw_data, width, height):
     if len(raw_data) < expected_len:
         raw_data += b'\x00' * (expected_len - len(raw_data))
 
-    output = bytearray()
-    for y in range(height):
-        src_start = y * src_stride
-        src_end = src_start + src_stride
-        output.extend(raw_data[src_start:src_end])
-        if padding > 0:
-            output.extend(b'\x00' * padding)
+    # Zero-copy row views, stitched together by one join with the padding
+    # as separator; the trailing empty row puts padding after the last row
+    view = memoryview(raw_data)
+    rows = [view[y * src_stride:(y + 1) * src_stride] for y in range(height)]
+    rows.append(b'')
 
-    return bytes(output)
+    return (b'\x00' * padding).join(rows)
 
 
+@lru_cache(maxsize=256)
 def create_bmp_header(width, height):
     """Generate BMP file header for RGB565 format with bit masks.
 
@@ -118,26 +144,9 @@ def create_bmp_header(width, height):
     headers_size = 14 + 40 + 12
     file_size = headers_size + image_size
 
-    header = b'BM'
-    header += struct.pack('<I', file_size)
-    header += b'\x00\x00\x00\x00'
-    header += struct.pack('<I', headers_size)
-    header += struct.pack('<I', 40)
-    header += struct.pack('<i', width)
-    header += struct.pack('<i', -height)
-    header += struct.pack('<H', 1)
-    header += struct.pack('<H', 16)
-    header += struct.pack('<I', 3)
-    header += struct.pack('<I', image_size)
-    header += struct.pack('<i', 2835)
-    header += struct.pack('<i', 2835)
-    header += struct.pack('<I', 0)
-    header += struct.pack('<I', 0)
-    header += struct.pack('<I', 0xF800)
-    header += struct.pack('<I', 0x07E0)
-    header += struct.pack('<I', 0x001F)
-
-    return header
+    return _BMP_HEADER.pack(
+        b'BM', file_size, headers_size, 40, width, -height, 1, 16, 3,
+        image_size, 2835, 2835, 0, 0, 0xF800, 0x07E0, 0x001F)
 
 
 def sanitize_filename(original_name):
@@ -149,6 +158,9 @@ def sanitize_filename(original_name):
     Returns:
         Sanitized filename with only alphanumeric characters and safe symbols.
     """
+    if original_name.isascii():
+        return original_name.translate(_UNSAFE_ASCII).strip()
+
     safe = original_name.replace('/', '_').replace('\\', '_')
     return "".join(c if (c.isalnum() or c in "._-(), ") else "_" for c in safe).strip()
 
@@ -168,21 +180,38 @@ def convert_to_bmp(raw_data, width, height):
         return None
 
     expected_size = width * height * 2
-    if len(raw_data) < expected_size:
-        raw_data += b'\x00' * (expected_size - len(raw_data))
-
-    pixel_data = swap_bytes_16bit(raw_data[:expected_size])
-    pixel_data = restride_to_bmp(pixel_data, width, height)
+    src_stride, dst_stride, padding = get_stride_info(width)
     header = create_bmp_header(width, height)
 
-    return header + pixel_data
+    # Swap the pixels in a single buffer and emit padded rows straight
+    # from it, rather than materializing swapped and restrided copies; a
+    # short input only gets its missing tail zero-filled (keeping a final
+    # odd byte) instead of padding a copy of it
+    view = memoryview(raw_data)[:expected_size]
+    whole = len(view) & ~1
+    words = array.array('H')
+    words.frombytes(view[:whole])
+    if whole < expected_size:
+        words.frombytes(view[whole:].tobytes().ljust(expected_size - whole, b'\x00'))
+    words.byteswap()
+    pixels = memoryview(words).cast('B')
+
+    if padding == 0:
+        return header + pixels
+
+    # Fold the header into the first row so the whole file is built by a
+    # single join (see restride_to_bmp)
+    rows = [pixels[y * src_stride:(y + 1) * src_stride] for y in range(height)]
+    rows[0] = header + rows[0]
+    rows.append(b'')
+    return (b'\x00' * padding).join(rows)
 
 
 # ============================================================================
 # Intelligent Misalignment Detection Functions
 # ============================================================================
 
-def detect_offset_misalignment(part5_data, metadata_entries, rock26_offset):
+def detect_offset_misalignment(part5_data, metadata, rock26_offset):
     """Detect Bootloader field reorganization pattern in metadata table.
 
     This function performs statistical analysis to determine if metadata table
@@ -197,7 +226,7 @@ def detect_offset_misalignment(part5_data, metadata_entries, rock26_offset):
 
     Args:
         part5_data: Raw Part 5 firmware data containing all tables
-        metadata_entries: List of parsed metadata entry dictionaries
+        metadata: Parsed MetadataTable
         rock26_offset: Starting offset of ROCK26 table in Part 5
 
     Returns:
@@ -221,23 +250,25 @@ def detect_offset_misalignment(part5_data, metadata_entries, rock26_offset):
     detection_info = {
         'rock26_count': rock26_count,
         'rock26_sample_offsets': rock26_offsets[:5],
-        'metadata_count': len(metadata_entries),
+        'metadata_count': metadata.count,
         'checks': []
     }
 
     offset_shift_votes = {}
 
-    for rock26_idx in range(min(20, len(rock26_offsets))):
-        rock26_offset_val = rock26_offsets[rock26_idx]
+    # Index the metadata offsets reachable by any shift hypothesis so each
+    # ROCK26 offset finds its candidates with one hash lookup; indices are
+    # appended in order, keeping the vote insertion order of a shift sweep.
+    metadata_positions = {}
+    for metadata_idx in range(min(sample_count + 3, metadata.count)):
+        metadata_positions.setdefault(metadata.offsets[metadata_idx], []).append(metadata_idx)
 
-        for shift in range(-3, 4):
-            metadata_idx = rock26_idx + shift
+    for rock26_idx in range(sample_count):
+        for metadata_idx in metadata_positions.get(rock26_offsets[rock26_idx], ()):
+            shift = metadata_idx - rock26_idx
 
-            if 0 <= metadata_idx < len(metadata_entries):
-                metadata_offset_val = metadata_entries[metadata_idx]['offset']
-
-                if metadata_offset_val == rock26_offset_val:
-                    offset_shift_votes[shift] = offset_shift_votes.get(shift, 0) + 1
+            if -3 <= shift <= 3:
+                offset_shift_votes[shift] = offset_shift_votes.get(shift, 0) + 1
 
     detection_info['checks'].append({
         'name': 'ROCK26-Metadata correspondence statistics',
@@ -258,21 +289,21 @@ def detect_offset_misalignment(part5_data, metadata_entries, rock26_offset):
 
         # Check for Flash metadata structure pattern
         # Entry 0 offset appears invalid because fields are stored in Entry[1]
-        entry0 = metadata_entries[0]
+        entry0_offset = metadata.offsets[0]
         has_flash_metadata_structure = (
-            entry0['offset'] == 0 or
-            entry0['offset'] >= len(part5_data) or
-            entry0['offset'] == 0xF564F564 or
-            entry0['offset'] == 0xB7B5D7B5 or
-            entry0['offset'] == 0x00000000 or
-            entry0['offset'] == 0xC308C308 or
-            entry0['offset'] == 0x45294529
+            entry0_offset == 0 or
+            entry0_offset >= len(part5_data) or
+            entry0_offset == 0xF564F564 or
+            entry0_offset == 0xB7B5D7B5 or
+            entry0_offset == 0x00000000 or
+            entry0_offset == 0xC308C308 or
+            entry0_offset == 0x45294529
         )
 
         detection_info['checks'].append({
             'name': 'Flash metadata structure detection',
             'result': has_flash_metadata_structure,
-            'offset': hex(entry0['offset'])
+            'offset': hex(entry0_offset)
         })
 
         if best_shift == 1:
@@ -292,11 +323,10 @@ def detect_offset_misalignment(part5_data, metadata_entries, rock26_offset):
         detection_info['conclusion'] = "Statistical analysis failed, falling back to single-point detection"
 
         if rock26_offsets:
-            first_match_index = None
-            for i, entry in enumerate(metadata_entries):
-                if entry['offset'] == rock26_offsets[0]:
-                    first_match_index = i
-                    break
+            try:
+                first_match_index = metadata.offsets.index(rock26_offsets[0])
+            except ValueError:
+                first_match_index = None
 
             if first_match_index is not None:
                 misalignment = first_match_index - 1
@@ -348,34 +378,38 @@ def find_metadata_table_by_rock26_anchor(part5_data):
     except:
         return None
 
-    matching_positions = []
-
-    for pos in range(0, len(part5_data) - METADATA_ENTRY_SIZE, 4):
-        try:
-            entry_offset = struct.unpack('<I', part5_data[pos + OFFSET_FIELD_POS:pos + OFFSET_FIELD_POS + 4])[0]
-
-            if entry_offset == anchor_offset:
-                name_bytes = part5_data[pos + 32:pos + 96]
-                name = name_bytes.split(b'\x00')[0].decode('ascii', errors='ignore')
-
-                if name.endswith('.BMP') and len(name) >= 3:
-                    matching_positions.append(pos)
-        except:
-            continue
+    # Let bytes.find() skip straight to each occurrence of the anchor value
+    # instead of unpacking every aligned word; entries are 4-byte aligned,
+    # so only hits whose entry start lands on a word boundary count.
+    needle = struct.pack('<I', anchor_offset)
+    scan_end = len(part5_data) - METADATA_ENTRY_SIZE
+    first_match = None
+
+    field_pos = part5_data.find(needle, OFFSET_FIELD_POS)
+    while field_pos != -1 and field_pos - OFFSET_FIELD_POS < scan_end:
+        pos = field_pos - OFFSET_FIELD_POS
+        if pos % 4 == 0:
+            name_bytes = part5_data[pos + 32:pos + 96]
+            name = name_bytes.split(b'\x00')[0].decode('ascii', errors='ignore')
+
+            if name.endswith('.BMP') and len(name) >= 3:
+                first_match = pos
+                break
+        field_pos = part5_data.find(needle, field_pos + 1)
 
-    if not matching_positions:
+    if first_match is None:
         return None
 
-    first_match = min(matching_positions)
-
     table_start = first_match
     while table_start >= METADATA_ENTRY_SIZE:
         test_pos = table_start - METADATA_ENTRY_SIZE
-        test_entry = part5_data[test_pos:test_pos + METADATA_ENTRY_SIZE]
-        test_name = test_entry[32:96].split(b'\x00')[0].decode('ascii', errors='ignore')
+        name_bytes = part5_data[test_pos + 32:test_pos + 96].split(b'\x00')[0]
+        test_name = name_bytes.decode('ascii', errors='ignore')
 
         if test_name and test_name.endswith('.BMP') and len(test_name) >= 3:
-            if all(c.isprintable() or c in '._-(), ' for c in test_name):
+            # Deleting every byte that decodes to a printable character (or is
+            # dropped by the decode) leaves only the disqualifying ones
+            if not name_bytes.translate(None, _NAME_OK_BYTES):
                 table_start = test_pos
             else:
                 break
@@ -419,39 +453,27 @@ def parse_metadata_table_part5(part5_data, table_start):
         table_start: Starting offset of metadata table
 
     Returns:
-        List of metadata entry dictionaries containing index, offset, width, height, and name.
+        MetadataTable holding one column per field, indexed by entry index.
     """
-    METADATA_ENTRY_SIZE = 108
-    entries = []
-    pos = table_start
-
-    while pos + METADATA_ENTRY_SIZE <= len(part5_data):
-        entry = part5_data[pos:pos + 108]
-
-        name_bytes = entry[32:96]
+    entry_count = (len(part5_data) - table_start) // _METADATA_ENTRY.size
+    table = part5_data[table_start:table_start + entry_count * _METADATA_ENTRY.size]
+    offsets = array.array('I')
+    widths = array.array('I')
+    heights = array.array('I')
+    names = []
+
+    for offset, width, height, name_bytes in _METADATA_ENTRY.iter_unpack(table):
         name = name_bytes.split(b'\x00')[0].decode('ascii', errors='ignore')
 
         if not name or len(name) < 3:
             break
 
-        try:
-            offset = struct.unpack('<I', entry[20:24])[0]
-            width = struct.unpack('<I', entry[24:28])[0]
-            height = struct.unpack('<I', entry[28:32])[0]
-
-            entries.append({
-                'index': len(entries),
-                'offset': offset,
-                'width': width,
-                'height': height,
-                'name': name
-            })
-        except:
-            break
-
-        pos += METADATA_ENTRY_SIZE
+        offsets.append(offset)
+        widths.append(width)
+        heights.append(height)
+        names.append(name)
 
-    return entries
+    return MetadataTable(offsets, widths, heights, names, len(names))
 
 def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
     """Intelligently detect and extract bitmaps from firmware image.
@@ -476,12 +498,12 @@ def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
     print(f"Processing firmware: {version} - {img_path.name}")
     print(f"{'='*80}")
 
-    with open(img_path, 'rb') as f:
-        img_data = f.read()
-
-    part5_info = struct.unpack('<IIII', img_data[0x14C:0x15C])
-    part5_offset, part5_size, _, _ = part5_info
-    part5_data = img_data[part5_offset:part5_offset + part5_size]
+    # Map the image and copy out only Part 5, instead of reading the whole
+    # file and then slicing a second copy of the partition from it
+    with open(img_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as img_data:
+        part5_info = struct.unpack('<IIII', img_data[0x14C:0x15C])
+        part5_offset, part5_size, _, _ = part5_info
+        part5_data = img_data[part5_offset:part5_offset + part5_size]
 
     print(f"  Part 5 offset: 0x{part5_offset:08X}")
     print(f"  Part 5 size: {len(part5_data):,} bytes")
@@ -500,12 +522,12 @@ def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
 
     print(f"  ✓ Metadata table location: 0x{table_start:X}")
 
-    metadata_entries = parse_metadata_table_part5(part5_data, table_start)
-    print(f"  ✓ Parsed {len(metadata_entries)} metadata entries")
+    metadata = parse_metadata_table_part5(part5_data, table_start)
+    print(f"  ✓ Parsed {metadata.count} metadata entries")
 
     print(f"\n  🔍 Detecting offset misalignment...")
     misalignment, first_valid_entry, detection_info = detect_offset_misalignment(
-        part5_data, metadata_entries, rock26_offset
+        part5_data, metadata, rock26_offset
     )
 
     print(f"  Detection results:")
@@ -530,34 +552,33 @@ def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
 
     # When misalignment = 1, Entry 0 CAN still be extracted using Entry[1]'s offset
     start_index = 0
-    end_index = len(metadata_entries) - (1 if misalignment > 0 else 0)
+    end_index = metadata.count - (1 if misalignment > 0 else 0)
 
     for i in range(start_index, end_index):
-        entry = metadata_entries[i]
-        resource_id = entry['index']
+        resource_id = i
 
         if misalignment > 0:
             target_index = i + misalignment
-            if target_index >= len(metadata_entries):
+            if target_index >= metadata.count:
                 continue
-            offset = metadata_entries[target_index]['offset']
+            offset = metadata.offsets[target_index]
         elif misalignment < 0:
             target_index = i + misalignment
             if target_index < 0:
                 continue
-            offset = metadata_entries[target_index]['offset']
+            offset = metadata.offsets[target_index]
         else:
-            offset = entry['offset']
+            offset = metadata.offsets[i]
 
-        name = entry['name']
+        name = metadata.names[i]
 
         # Get width/height from Entry[i+1] (Bootloader field reorganization)
-        if i + 1 < len(metadata_entries):
-            width = metadata_entries[i + 1]['width']
-            height = metadata_entries[i + 1]['height']
+        if i + 1 < metadata.count:
+            width = metadata.widths[i + 1]
+            height = metadata.heights[i + 1]
         else:
-            width = entry['width']
-            height = entry['height']
+            width = metadata.widths[i]
+            height = metadata.heights[i]
 
         if offset == 0 or offset >= len(part5_data):
             continue
@@ -581,7 +602,7 @@ def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
             success_count += 1
 
             if i < 12 or i % 200 == 0:
-                wh_source = f"Entry[{i+1}]" if i + 1 < len(metadata_entries) else f"Entry[{i}]"
+                wh_source = f"Entry[{i+1}]" if i + 1 < metadata.count else f"Entry[{i}]"
                 print(f"  {resource_id:>4} {name:<30} {width}x{height:>6} ({wh_source})   ✓")
         else:
             error_count += 1
@@ -599,6 +620,28 @@ def extract_part5_bitmaps_smart(img_path, output_base_dir, debug=False):
     }
 
 
+def _extract_one(img_file, output_dir, debug):
+    """Extract one firmware image in a worker process.
+
+    Args:
+        img_file: Path to firmware .IMG file
+        output_dir: Base directory for output files
+        debug: If True, print detailed detection information
+
+    Returns:
+        Tuple of (extraction statistics or None, captured stdout).
+    """
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        try:
+            result = extract_part5_bitmaps_smart(img_file, output_dir, debug=debug)
+        except Exception as e:
+            result = None
+            print(f"\n  ✗ Error: {e}")
+            # Keep the traceback with this firmware's buffered output
+            traceback.print_exc(file=sys.stdout)
+    return result, output.getvalue()
+
+
 def main():
     """Main entry point: Process all firmware versions.
 
@@ -632,15 +675,13 @@ def main():
 
     results = []
 
-    for img_file in img_files:
-        try:
-            result = extract_part5_bitmaps_smart(img_file, output_dir, debug=debug_mode)
+    # Firmware versions are independent: extract them in parallel and print
+    # each one's buffered output back in file order
+    with ProcessPoolExecutor(max_workers=min(len(img_files), os.cpu_count() or 1)) as pool:
+        for result, output in pool.map(_extract_one, img_files, repeat(output_dir), repeat(debug_mode)):
+            sys.stdout.write(output)
             if result:
                 results.append(result)
-        except Exception as e:
-            print(f"\n  ✗ Error: {e}")
-            import traceback
-            traceback.print_exc()
 
     print(f"\n{'='*80}")
     print("Summary Report")
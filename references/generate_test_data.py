@@ -12,13 +12,36 @@ Test Categories:
 
 Output Format:
     JSON file containing input/output pairs for each test case, organized by category.
+    Byte outputs (BMP data, headers, pixel data) are stored as base64 strings.
 """
 
 import struct
+import array
+import base64
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: only speeds up writing the JSON file
+    orjson = None
+
+# BITMAPFILEHEADER + BITMAPINFOHEADER + RGB565 channel masks (66 bytes)
+_BMP_HEADER = struct.Struct('<2sI4xIIiiHHIIiiIIIII')
+
+# BITMAPFILEHEADER + BITMAPINFOHEADER of a monochrome BMP (54 bytes)
+_MONO_BMP_HEADER = struct.Struct('<HIHHIIiiHHIIiiII')
+
+# Two-colour palette: white (0), black (1)
+_MONO_BMP_PALETTE = bytes([0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00])
+
+
+def _to_base64(data):
+    """Encode a byte payload for the JSON test data."""
+    return base64.b64encode(data).decode('ascii')
+
 
 # ============================================================================
 # Bitmap Conversion Functions
@@ -41,13 +64,13 @@ def swap_bytes_16bit(data):
         >>> swap_bytes_16bit(b'\\x12\\x34\\x56\\x78')
         b'\\x34\\x12\\x78\\x56'
     """
-    arr = bytearray(data)
-    if len(arr) % 2 != 0:
-        arr = arr[:-1]
-    arr[0::2], arr[1::2] = arr[1::2], arr[0::2]
-    return bytes(arr)
+    words = array.array('H')
+    words.frombytes(data[:len(data) & ~1])
+    words.byteswap()
+    return words.tobytes()
 
 
+@lru_cache(maxsize=256)
 def get_stride_info(width):
     """Calculate stride and padding information for BMP row alignment.
 
@@ -92,17 +115,16 @@ def restride_to_bmp(raw_data, width, height):
     if len(raw_data) < expected_len:
         raw_data += b'\x00' * (expected_len - len(raw_data))
 
-    output = bytearray()
-    for y in range(height):
-        src_start = y * src_stride
-        src_end = src_start + src_stride
-        output.extend(raw_data[src_start:src_end])
-        if padding > 0:
-            output.extend(b'\x00' * padding)
+    # Zero-copy row views, stitched together by one join with the padding
+    # as separator; the trailing empty row puts padding after the last row
+    view = memoryview(raw_data)
+    rows = [view[y * src_stride:(y + 1) * src_stride] for y in range(height)]
+    rows.append(b'')
 
-    return bytes(output)
+    return (b'\x00' * padding).join(rows)
 
 
+@lru_cache(maxsize=256)
 def create_bmp_header(width, height):
     """Generate BMP file header for RGB565 format with bit masks.
 
@@ -121,26 +143,13 @@ def create_bmp_header(width, height):
     headers_size = 14 + 40 + 12
     file_size = headers_size + image_size
 
-    header = b'BM'
-    header += struct.pack('<I', file_size)
-    header += b'\x00\x00\x00\x00'
-    header += struct.pack('<I', headers_size)
-    header += struct.pack('<I', 40)
-    header += struct.pack('<i', width)
-    header += struct.pack('<i', -height)
-    header += struct.pack('<H', 1)
-    header += struct.pack('<H', 16)
-    header += struct.pack('<I', 3)
-    header += struct.pack('<I', image_size)
-    header += struct.pack('<i', 2835)
-    header += struct.pack('<i', 2835)
-    header += struct.pack('<I', 0)
-    header += struct.pack('<I', 0)
-    header += struct.pack('<I', 0xF800)  # Red mask (5 bits)
-    header += struct.pack('<I', 0x07E0)  # Green mask (6 bits)
-    header += struct.pack('<I', 0x001F)  # Blue mask (5 bits)
-
-    return header
+    return _BMP_HEADER.pack(
+        b'BM', file_size, headers_size, 40, width, -height, 1, 16, 3,
+        image_size, 2835, 2835, 0, 0,
+        0xF800,  # Red mask (5 bits)
+        0x07E0,  # Green mask (6 bits)
+        0x001F,  # Blue mask (5 bits)
+    )
 
 
 def convert_to_bmp(raw_data, width, height):
@@ -163,20 +172,115 @@ def convert_to_bmp(raw_data, width, height):
         return None
 
     expected_size = width * height * 2
-    if len(raw_data) < expected_size:
-        raw_data += b'\x00' * (expected_size - len(raw_data))
 
-    pixel_data = swap_bytes_16bit(raw_data[:expected_size])
-    pixel_data = restride_to_bmp(pixel_data, width, height)
+    # Stride arithmetic inline (see get_stride_info); the header is cached
+    src_stride = width * 2
+    padding = ((src_stride + 3) & ~3) - src_stride
     header = create_bmp_header(width, height)
 
-    return header + pixel_data
+    # Swap the pixels in a single buffer and join padded rows straight from
+    # it, rather than materializing swapped and restrided copies; a short
+    # input only gets its missing tail zero-filled (keeping a final odd
+    # byte) instead of padding a copy of it
+    view = memoryview(raw_data)[:expected_size]
+    whole = len(view) & ~1
+    words = array.array('H')
+    words.frombytes(view[:whole])
+    if whole < expected_size:
+        words.frombytes(view[whole:].tobytes().ljust(expected_size - whole, b'\x00'))
+    words.byteswap()
+    pixels = memoryview(words).cast('B')
+
+    # Fold the header into the first row so the whole file is built by a
+    # single join, with no further copy to prepend it
+    rows = [pixels[y * src_stride:(y + 1) * src_stride] for y in range(height)]
+    rows[0] = header + rows[0]
+    rows.append(b'')
+
+    return (b'\x00' * padding).join(rows)
 
 
 # ============================================================================
 # Font Decoding Functions
 # ============================================================================
 
+# Bits of every byte value, most significant first: a 16-pixel row is the
+# concatenation of its high and low byte entries
+_BYTE_BITS = [bytes((value >> bit) & 1 for bit in range(7, -1, -1)) for value in range(256)]
+
+# Pixel bits as ASCII binary digits, for packing a row with int(..., 2)
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _v8_byte_order(config):
+    """Resolve the V8 sw_mcu swaps of a 3-bit config to a row byte order.
+
+    Every swap in the V8 decoding only reorders the two bytes of a row, so
+    the whole sequence can be applied once to the byte positions instead of
+    to every row's value.
+
+    Args:
+        config: Lookup bits 3-5 (bit 0 = sw_mcu_bits, bit 1 = sw_mcu_hw_swap,
+            bit 2 = sw_mcu_byte_swap)
+
+    Returns:
+        Tuple of (high, low) byte offsets within a row: the row's pixel value
+        is (chunk[i + high] << 8) | chunk[i + low].
+    """
+    sw_mcu_bits = config & 1
+    sw_mcu_hw_swap = (config >> 1) & 1
+    sw_mcu_byte_swap = (config >> 2) & 1
+
+    if sw_mcu_bits == 1:
+        high, low = 1, 0
+        if sw_mcu_byte_swap:
+            high, low = low, high
+    else:
+        high, low = (1, 0) if sw_mcu_hw_swap == sw_mcu_byte_swap else (0, 1)
+        if sw_mcu_byte_swap:
+            high, low = low, high
+        if sw_mcu_hw_swap:
+            high, low = low, high
+
+    # The decoder's trailing swap, folded in here so decoding never branches
+    do_final_swap = not ((sw_mcu_bits == 1) and (sw_mcu_byte_swap == 1))
+    if do_final_swap:
+        high, low = low, high
+
+    return high, low
+
+
+# Row byte order shared by all 8 sw_mcu configs. With the trailing swap folded
+# in, every config resolves to (0, 1): the swaps always cancel out and no row's
+# bytes are reordered.
+_V8_ROW_ORDER = _v8_byte_order(0)
+assert all(_v8_byte_order(config) == _V8_ROW_ORDER for config in range(8))
+
+
+def _decode_v8_rows(chunk):
+    """Decode a V8 chunk into pixel rows (see decode_v8)."""
+    high, low = _V8_ROW_ORDER
+
+    # Unpack all rows at once from the strided high and low byte slices; zip
+    # stops at the last complete row, dropping an odd trailing byte
+    return [_BYTE_BITS[h] + _BYTE_BITS[l] for h, l in zip(chunk[high::2], chunk[low::2])]
+
+
+def make_v8_decoder(lookup_val):
+    """Return a decoder for V8 chunks sharing one lookup configuration.
+
+    The configuration flags never change the result (see _V8_ROW_ORDER), so
+    every lookup value gets the same decoder.
+
+    Args:
+        lookup_val: Configuration value from lookup table containing decode flags
+
+    Returns:
+        Callable taking a chunk and returning its pixel rows, as decode_v8.
+    """
+    return _decode_v8_rows
+
+
 def decode_v8(chunk, lookup_val):
     """Decode V8 format font data into pixel rows.
 
@@ -189,48 +293,18 @@ def decode_v8(chunk, lookup_val):
         lookup_val: Configuration value from lookup table containing decode flags
 
     Returns:
-        List of pixel rows, where each row is a list of bits (0 or 1).
-        Each character is 16 pixels wide by 16 pixels tall.
+        List of pixel rows, where each row is a bytes object of bits (0 or 1),
+        one byte per pixel. Each character is 16 pixels wide by 16 pixels tall.
 
     Configuration Flags (from lookup_val & 0xFF):
         - bit 3 (sw_mcu_bits): Controls bit interpretation mode
         - bit 4 (sw_mcu_hw_swap): Controls hardware byte swapping
         - bit 5 (sw_mcu_byte_swap): Controls software byte swapping
     """
-    config_byte = lookup_val & 0xFF
-    sw_mcu_bits = (config_byte >> 3) & 1
-    sw_mcu_hw_swap = (config_byte >> 4) & 1
-    sw_mcu_byte_swap = (config_byte >> 5) & 1
-
-    pixels = []
-    for i in range(0, len(chunk), 2):
-        if i + 1 >= len(chunk):
-            break
-
-        b0, b1 = chunk[i], chunk[i + 1]
-
-        if sw_mcu_bits == 1:
-            val = (b1 << 8) | b0
-            if sw_mcu_byte_swap:
-                val = ((val & 0xFF) << 8) | ((val >> 8) & 0xFF)
-            final_pixel = val
-        else:
-            cycle_1, cycle_2 = (b1, b0) if sw_mcu_hw_swap == sw_mcu_byte_swap else (b0, b1)
-            if sw_mcu_byte_swap:
-                cycle_1, cycle_2 = cycle_2, cycle_1
-            if sw_mcu_hw_swap:
-                cycle_1, cycle_2 = cycle_2, cycle_1
-            final_pixel = cycle_2 | (cycle_1 << 8)
-
-        if not ((sw_mcu_bits == 1) and (sw_mcu_byte_swap == 1)):
-            final_pixel = ((final_pixel & 0xFF) << 8) | ((final_pixel >> 8) & 0xFF)
-
-        row_bits = [(final_pixel >> bit) & 1 for bit in range(15, -1, -1)]
-        pixels.append(row_bits)
-
-    return pixels
+    return make_v8_decoder(lookup_val)(chunk)
 
 
+@lru_cache(maxsize=256)
 def write_bmp_header_only(width=16, height=16):
     """Generate monochrome BMP file header.
 
@@ -244,7 +318,6 @@ def write_bmp_header_only(width=16, height=16):
     Returns:
         Complete BMP header as bytes (62 bytes total).
     """
-    import struct as struct_pkg
     bfType = 0x4D42
     bfOffBits = 62
     biSize = 40
@@ -255,28 +328,12 @@ def write_bmp_header_only(width=16, height=16):
 
     file_size = bfOffBits + biSizeImage
 
-    header = bytearray()
-    header.extend(struct_pkg.pack('<H', bfType))
-    header.extend(struct_pkg.pack('<I', file_size))
-    header.extend(struct_pkg.pack('<H', 0))
-    header.extend(struct_pkg.pack('<H', 0))
-    header.extend(struct_pkg.pack('<I', bfOffBits))
-    header.extend(struct_pkg.pack('<I', biSize))
-    header.extend(struct_pkg.pack('<i', biWidth))
-    header.extend(struct_pkg.pack('<i', biHeight))
-    header.extend(struct_pkg.pack('<H', 1))
-    header.extend(struct_pkg.pack('<H', biBitCount))
-    header.extend(struct_pkg.pack('<I', 0))
-    header.extend(struct_pkg.pack('<I', biSizeImage))
-    header.extend(struct_pkg.pack('<i', 2835))
-    header.extend(struct_pkg.pack('<i', 2835))
-    header.extend(struct_pkg.pack('<I', 2))
-    header.extend(struct_pkg.pack('<I', 2))
-
-    for color in [0xFFFFFF, 0x000000]:
-        header.extend(struct_pkg.pack('BBBB', color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF, 0))
-
-    return bytes(header)
+    header = _MONO_BMP_HEADER.pack(
+        bfType, file_size, 0, 0, bfOffBits,
+        biSize, biWidth, biHeight, 1, biBitCount, 0, biSizeImage, 2835, 2835, 2, 2,
+    )
+
+    return header + _MONO_BMP_PALETTE
 
 
 def encode_mono_bmp_pixels(pixels, width=16, height=16):
@@ -294,33 +351,16 @@ def encode_mono_bmp_pixels(pixels, width=16, height=16):
         Encoded pixel data as bytes, ready to be written after the BMP header.
     """
     row_bytes = ((width + 31) // 32) * 4
-    pixel_data = bytearray()
 
+    # Pack each row (bottom-up) by parsing its bits as one binary number,
+    # left-aligned in the row's padded bytes; missing pixels stay 0
+    rows = []
     for y in range(height - 1, -1, -1):
-        row_data = []
-        current_byte = 0
-        bit_count = 0
-
-        for x in range(width):
-            bit = pixels[y][x] if y < len(pixels) and x < len(pixels[y]) else 0
-            current_byte = (current_byte << 1) | bit
-            bit_count += 1
-
-            if bit_count == 8:
-                row_data.append(current_byte)
-                current_byte = 0
-                bit_count = 0
-
-        if bit_count > 0:
-            current_byte <<= (8 - bit_count)
-            row_data.append(current_byte)
+        bits = bytes(pixels[y][:width]) if y < len(pixels) else b''
+        value = int(b'0' + bits.translate(_BIT_DIGITS), 2)
+        rows.append((value << (row_bytes * 8 - len(bits))).to_bytes(row_bytes, 'big'))
 
-        while len(row_data) < row_bytes:
-            row_data.append(0)
-
-        pixel_data.extend(row_data)
-
-    return bytes(pixel_data)
+    return b''.join(rows)
 
 
 # ============================================================================
@@ -361,8 +401,8 @@ def generate_bitmap_test_data():
             'height': 2
         },
         'output': {
-            'bmp_data': list(result) if result else None,
-            'first_bytes': list(result[:10]) if result else None
+            'bmp_data': _to_base64(result) if result else None,
+            'first_bytes': _to_base64(result[:10]) if result else None
         }
     })
 
@@ -382,7 +422,7 @@ def generate_bitmap_test_data():
             'height': 4
         },
         'output': {
-            'bmp_data': list(result) if result else None
+            'bmp_data': _to_base64(result) if result else None
         }
     })
 
@@ -395,7 +435,7 @@ def generate_bitmap_test_data():
             'data': list(input_data)
         },
         'output': {
-            'swapped': list(swapped)
+            'swapped': _to_base64(swapped)
         }
     })
 
@@ -423,7 +463,7 @@ def generate_bitmap_test_data():
             'height': 10
         },
         'output': {
-            'aligned_data': list(aligned)
+            'aligned_data': _to_base64(aligned)
         }
     })
 
@@ -434,7 +474,7 @@ def generate_bitmap_test_data():
             'name': f'create_bmp_header {width}x{height}',
             'input': {'width': width, 'height': height},
             'output': {
-                'header': list(header),
+                'header': _to_base64(header),
                 'header_size': len(header)
             }
         })
@@ -486,7 +526,7 @@ def generate_font_test_data():
                 'lookup_val': lookup_val
             },
             'output': {
-                'pixels': pixels  # List of lists of bits
+                'pixels': [list(row) for row in pixels]  # List of lists of bits
             }
         })
 
@@ -497,7 +537,7 @@ def generate_font_test_data():
             'name': f'write_bmp_header_only {width}x{height}',
             'input': {'width': width, 'height': height},
             'output': {
-                'header': list(header),
+                'header': _to_base64(header),
                 'header_size': len(header)
             }
         })
@@ -514,7 +554,7 @@ def generate_font_test_data():
             'height': 16
         },
         'output': {
-            'pixel_data': list(pixel_data)
+            'pixel_data': _to_base64(pixel_data)
         }
     })
 
@@ -529,7 +569,7 @@ def generate_font_test_data():
             'height': 16
         },
         'output': {
-            'pixel_data': list(pixel_data)
+            'pixel_data': _to_base64(pixel_data)
         }
     })
 
@@ -544,13 +584,61 @@ def generate_font_test_data():
             'height': 16
         },
         'output': {
-            'pixel_data': list(pixel_data)
+            'pixel_data': _to_base64(pixel_data)
         }
     })
 
     return {'font_decoding': tests}
 
 
+def count_offset_shift_votes(rock26_offsets, metadata_offsets):
+    """Count how many ROCK26 offsets each index shift hypothesis explains.
+
+    A shift votes once for every ROCK26 entry whose offset equals that of
+    the metadata entry shifted from it, for shifts -3 to +3. Metadata
+    offsets are indexed once so each ROCK26 offset finds its candidates
+    with a single hash lookup instead of probing all seven shifts.
+
+    Args:
+        rock26_offsets: Offsets from the ROCK26 table (ground truth)
+        metadata_offsets: Offset column of the metadata table
+
+    Returns:
+        Dictionary mapping shift to vote count, in the order a sweep over
+        ROCK26 indices and then ascending shifts first finds each shift.
+    """
+    metadata_positions = {}
+    for metadata_idx, metadata_offset in enumerate(metadata_offsets[:len(rock26_offsets) + 3]):
+        metadata_positions.setdefault(metadata_offset, []).append(metadata_idx)
+
+    offset_shift_votes = {}
+    for rock26_idx, rock26_offset_val in enumerate(rock26_offsets):
+        for metadata_idx in metadata_positions.get(rock26_offset_val, ()):
+            shift = metadata_idx - rock26_idx
+            if -3 <= shift <= 3:
+                offset_shift_votes[shift] = offset_shift_votes.get(shift, 0) + 1
+
+    return offset_shift_votes
+
+
+def metadata_entry_records(offsets, widths, heights, names):
+    """Rebuild per-entry dictionaries from metadata table columns.
+
+    Args:
+        offsets: Offset column
+        widths: Width column
+        heights: Height column
+        names: Name column
+
+    Returns:
+        List of metadata entry dictionaries, as recorded in the test input.
+    """
+    return [
+        {'index': i, 'offset': offset, 'width': width, 'height': height, 'name': name}
+        for i, (offset, width, height, name) in enumerate(zip(offsets, widths, heights, names))
+    ]
+
+
 def generate_misalignment_test_data():
     """Generate test cases for offset table misalignment detection.
 
@@ -569,25 +657,15 @@ def generate_misalignment_test_data():
 
     tests = []
     rock26_offsets = [0x1000, 0x1100, 0x1200, 0x1300, 0x1400]
-    metadata_entries = [
-        {'index': 0, 'offset': 0x0000, 'width': 10, 'height': 10, 'name': 'INVALID.BMP'},  # Invalid entry 0
-        {'index': 1, 'offset': 0x1000, 'width': 100, 'height': 100, 'name': 'IMG001.BMP'},  # Matches ROCK26[0]
-        {'index': 2, 'offset': 0x1100, 'width': 100, 'height': 100, 'name': 'IMG002.BMP'},  # Matches ROCK26[1]
-        {'index': 3, 'offset': 0x1200, 'width': 100, 'height': 100, 'name': 'IMG003.BMP'},
-        {'index': 4, 'offset': 0x1300, 'width': 100, 'height': 100, 'name': 'IMG004.BMP'},
-        {'index': 5, 'offset': 0x1400, 'width': 100, 'height': 100, 'name': 'IMG005.BMP'},
-    ]
+    # Metadata table as parallel columns: entry 0 is invalid, entry 1
+    # matches ROCK26[0], entry 2 matches ROCK26[1], and so on
+    metadata_offsets = [0x0000, 0x1000, 0x1100, 0x1200, 0x1300, 0x1400]
+    metadata_widths = [10, 100, 100, 100, 100, 100]
+    metadata_heights = [10, 100, 100, 100, 100, 100]
+    metadata_names = ['INVALID.BMP', 'IMG001.BMP', 'IMG002.BMP', 'IMG003.BMP', 'IMG004.BMP', 'IMG005.BMP']
 
     # Simulate detection logic
-    offset_shift_votes = {}
-    for rock26_idx in range(len(rock26_offsets)):
-        rock26_offset_val = rock26_offsets[rock26_idx]
-        for shift in range(-3, 4):
-            metadata_idx = rock26_idx + shift
-            if 0 <= metadata_idx < len(metadata_entries):
-                metadata_offset_val = metadata_entries[metadata_idx]['offset']
-                if metadata_offset_val == rock26_offset_val:
-                    offset_shift_votes[shift] = offset_shift_votes.get(shift, 0) + 1
+    offset_shift_votes = count_offset_shift_votes(rock26_offsets, metadata_offsets)
 
     best_shift = max(offset_shift_votes.items(), key=lambda x: x[1])[0] if offset_shift_votes else 0
     confidence = offset_shift_votes.get(best_shift, 0)
@@ -596,7 +674,8 @@ def generate_misalignment_test_data():
         'name': 'misalignment_detection +1 shift',
         'input': {
             'rock26_offsets': rock26_offsets,
-            'metadata_entries': metadata_entries
+            'metadata_entries': metadata_entry_records(
+                metadata_offsets, metadata_widths, metadata_heights, metadata_names)
         },
         'output': {
             'offset_shift_votes': offset_shift_votes,
@@ -606,21 +685,12 @@ def generate_misalignment_test_data():
     })
 
     # Test case 2: No misalignment
-    metadata_entries_aligned = [
-        {'index': 0, 'offset': 0x1000, 'width': 100, 'height': 100, 'name': 'IMG001.BMP'},
-        {'index': 1, 'offset': 0x1100, 'width': 100, 'height': 100, 'name': 'IMG002.BMP'},
-        {'index': 2, 'offset': 0x1200, 'width': 100, 'height': 100, 'name': 'IMG003.BMP'},
-    ]
+    aligned_offsets = [0x1000, 0x1100, 0x1200]
+    aligned_widths = [100, 100, 100]
+    aligned_heights = [100, 100, 100]
+    aligned_names = ['IMG001.BMP', 'IMG002.BMP', 'IMG003.BMP']
 
-    offset_shift_votes = {}
-    for rock26_idx in range(len(rock26_offsets)):
-        rock26_offset_val = rock26_offsets[rock26_idx]
-        for shift in range(-3, 4):
-            metadata_idx = rock26_idx + shift
-            if 0 <= metadata_idx < len(metadata_entries_aligned):
-                metadata_offset_val = metadata_entries_aligned[metadata_idx]['offset']
-                if metadata_offset_val == rock26_offset_val:
-                    offset_shift_votes[shift] = offset_shift_votes.get(shift, 0) + 1
+    offset_shift_votes = count_offset_shift_votes(rock26_offsets, aligned_offsets)
 
     best_shift = max(offset_shift_votes.items(), key=lambda x: x[1])[0] if offset_shift_votes else 0
     confidence = offset_shift_votes.get(best_shift, 0)
@@ -629,7 +699,8 @@ def generate_misalignment_test_data():
         'name': 'misalignment_detection no shift (aligned)',
         'input': {
             'rock26_offsets': rock26_offsets[:3],
-            'metadata_entries': metadata_entries_aligned
+            'metadata_entries': metadata_entry_records(
+                aligned_offsets, aligned_widths, aligned_heights, aligned_names)
         },
         'output': {
             'offset_shift_votes': offset_shift_votes,
@@ -641,6 +712,16 @@ def generate_misalignment_test_data():
     return {'misalignment_detection': tests}
 
 
+# Independent category generators, merged in this order. Each takes well
+# under a millisecond, so they run serially: a process pool would cost far
+# more to start than it saves.
+TEST_DATA_GENERATORS = (
+    generate_bitmap_test_data,
+    generate_font_test_data,
+    generate_misalignment_test_data,
+)
+
+
 def main():
     """Main entry point for test data generation.
 
@@ -655,13 +736,17 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     all_test_data = {}
-    all_test_data.update(generate_bitmap_test_data())
-    all_test_data.update(generate_font_test_data())
-    all_test_data.update(generate_misalignment_test_data())
+    for generate in TEST_DATA_GENERATORS:
+        all_test_data.update(generate())
 
     output_file = output_dir / 'python_test_data.json'
-    with open(output_file, 'w') as f:
-        json.dump(all_test_data, f, indent=2)
+    if orjson is not None:
+        # Same layout as json.dump(indent=2); vote histograms have int keys
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(all_test_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(all_test_data, f, indent=2)
 
     print(f"\nTest data written to: {output_file}")
 
@@ -52,6 +52,13 @@ function toUint8Array(arr: number[]): Uint8Array {
 	return new Uint8Array(arr);
 }
 
+/**
+ * Decode a base64 byte payload from the Python test data
+ */
+function fromBase64(data: string): number[] {
+	return Array.from(Buffer.from(data, 'base64'));
+}
+
 // Load test data immediately
 const pythonTestData = loadPythonTestData();
 
@@ -83,10 +90,10 @@ describe('Python Consistency Tests - Bitmap Conversion', () => {
 				const height = input.height ?? 0;
 
 				const result = convertToBmp(rawData, width, height);
-				const expectedOutput = testCase.output as { bmp_data?: number[] };
+				const expectedOutput = testCase.output as { bmp_data?: string };
 
 				expect(result).not.toBeNull();
-				expect(arraysEqual(Array.from(result!), expectedOutput.bmp_data ?? [])).toBe(true);
+				expect(arraysEqual(Array.from(result!), fromBase64(expectedOutput.bmp_data ?? ''))).toBe(true);
 			} else if (testCase.name.includes('invalid')) {
 				// Test invalid dimensions
 				const rawData = toUint8Array(input.raw_data ?? []);
@@ -100,10 +107,10 @@ describe('Python Consistency Tests - Bitmap Conversion', () => {
 			} else if (testCase.name.includes('swap_bytes_16bit')) {
 				// Test swapBytes16Bit
 				const data = toUint8Array(input.data ?? []);
-				const expectedOutput = testCase.output as { swapped: number[] };
+				const expectedOutput = testCase.output as { swapped: string };
 
 				const result = swapBytes16Bit(data);
-				expect(arraysEqual(Array.from(result), expectedOutput.swapped)).toBe(true);
+				expect(arraysEqual(Array.from(result), fromBase64(expectedOutput.swapped))).toBe(true);
 			} else if (testCase.name.includes('get_stride_info')) {
 				// Test stride info
 				const width = input.width as number;
@@ -124,18 +131,18 @@ describe('Python Consistency Tests - Bitmap Conversion', () => {
 				const rawData = toUint8Array(input.raw_data ?? []);
 				const width = input.width ?? 0;
 				const height = input.height ?? 0;
-				const expectedOutput = testCase.output as { aligned_data: number[] };
+				const expectedOutput = testCase.output as { aligned_data: string };
 
 				const result = restrideToBmp(rawData, width, height);
-				expect(arraysEqual(Array.from(result), expectedOutput.aligned_data)).toBe(true);
+				expect(arraysEqual(Array.from(result), fromBase64(expectedOutput.aligned_data))).toBe(true);
 			} else if (testCase.name.includes('create_bmp_header')) {
 				// Test createBmpHeader
 				const width = input.width ?? 0;
 				const height = input.height ?? 0;
-				const expectedOutput = testCase.output as { header: number[]; header_size: number };
+				const expectedOutput = testCase.output as { header: string; header_size: number };
 
 				const result = createBmpHeader(width, height);
-				expect(arraysEqual(Array.from(result), expectedOutput.header)).toBe(true);
+				expect(arraysEqual(Array.from(result), fromBase64(expectedOutput.header))).toBe(true);
 				expect(result.length).toBe(expectedOutput.header_size);
 			}
 		});
@@ -171,7 +178,7 @@ describe('Python Consistency Tests - Font Decoding', () => {
 				// Test monochrome BMP header creation
 				const width = input.width ?? 16;
 				const height = input.height ?? 16;
-				const expectedOutput = testCase.output as { header: number[]; header_size: number };
+				const expectedOutput = testCase.output as { header: string; header_size: number };
 
 				// Create a simple pixel pattern
 				const pixels: boolean[][] = [];
@@ -187,20 +194,20 @@ describe('Python Consistency Tests - Font Decoding', () => {
 
 				// Check header matches (first 62 bytes are header)
 				const resultHeader = Array.from(result.slice(0, 62));
-				expect(resultHeader).toEqual(expectedOutput.header);
+				expect(resultHeader).toEqual(fromBase64(expectedOutput.header));
 				expect(result.length).toBeGreaterThanOrEqual(expectedOutput.header_size);
 			} else if (testCase.name.includes('encode_mono_bmp_pixels')) {
 				// Test monochrome BMP pixel encoding
 				const pixels = input.pixels as PixelData;
 				const width = input.width ?? 16;
 				const height = input.height ?? 16;
-				const expectedOutput = testCase.output as { pixel_data: number[] };
+				const expectedOutput = testCase.output as { pixel_data: string };
 
 				const result = createMonoBmp(pixels, width, height);
 
 				// The pixel data starts at offset 62 (after header)
 				const resultPixelData = Array.from(result.slice(62));
-				expect(resultPixelData).toEqual(expectedOutput.pixel_data);
+				expect(resultPixelData).toEqual(fromBase64(expectedOutput.pixel_data));
 			}
 		});
 	});